@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+from typing import List, Optional, Tuple
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+_ALLOW_ORIGIN = (b"access-control-allow-origin", b"*")
+_PREFLIGHT_HEADERS: Tuple[Tuple[bytes, bytes], ...] = (
+    _ALLOW_ORIGIN,
+    (b"access-control-allow-methods", b"DELETE, GET, HEAD, OPTIONS, PATCH, POST, PUT"),
+    (b"access-control-max-age", b"600"),
+    (b"content-type", b"text/plain; charset=utf-8"),
+    (b"content-length", b"2"),
+)
+
+
+class WildcardCORSMiddleware:
+    """CORS for ``allowed_origins == ["*"]`` using precomputed response headers.
+
+    Equivalent to Starlette's ``CORSMiddleware`` with every origin, method and
+    header allowed, minus the per-request origin matching. Authentication uses
+    bearer tokens rather than cookies, so the origin is never echoed back.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        if scope["method"] == "OPTIONS":
+            requested_headers = _preflight_request_headers(scope)
+            if requested_headers is not None:
+                await _send_preflight(send, requested_headers)
+                return
+
+        async def send_with_cors(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                # Build a new list: responses may reuse their header list.
+                message["headers"] = [*message.get("headers", ()), _ALLOW_ORIGIN]
+            await send(message)
+
+        await self.app(scope, receive, send_with_cors)
+
+
+def _preflight_request_headers(scope: Scope) -> Optional[bytes]:
+    """Return the requested headers for a CORS preflight, ``None`` otherwise."""
+    is_preflight = False
+    requested = b""
+    for name, value in scope["headers"]:
+        if name == b"access-control-request-method":
+            is_preflight = True
+        elif name == b"access-control-request-headers":
+            requested = value
+    return requested if is_preflight else None
+
+
+async def _send_preflight(send: Send, requested_headers: bytes) -> None:
+    headers: List[Tuple[bytes, bytes]] = list(_PREFLIGHT_HEADERS)
+    if requested_headers:
+        # "*" does not cover Authorization, so echo what the browser asked for.
+        headers.append((b"access-control-allow-headers", requested_headers))
+    await send({"type": "http.response.start", "status": 200, "headers": headers})
+    await send({"type": "http.response.body", "body": b"OK"})
@@ -1,14 +1,32 @@
 from __future__ import annotations
 
-import uuid
-from pathlib import Path
-
-from fastapi import APIRouter, Depends, File, HTTPException, Response, UploadFile, status
+import base64
+import hashlib
+from datetime import datetime
+from typing import Iterator, List, Optional, Tuple, Union
+from weakref import WeakKeyDictionary
+
+import orjson
+from fastapi import (
+    APIRouter,
+    Depends,
+    File,
+    HTTPException,
+    Query,
+    Request,
+    Response,
+    UploadFile,
+    status,
+)
+from fastapi.responses import ORJSONResponse, StreamingResponse
 from fastapi.security import HTTPAuthorizationCredentials
 from sqlalchemy.orm import Session
 
 from ..schemas import (
+    SESSION_ADAPTER,
+    SESSION_LIST_ADAPTER,
     AnalysisResponse,
+    BatchAnalysisResponse,
     DetectionMetadataSchema,
     DetectionResponseSchema,
     DashboardMetricsResponse,
@@ -19,20 +37,23 @@ from ..schemas import (
     SessionCreateRequest,
     SessionCreateResponse,
     SessionListResponse,
+    SessionPageResponse,
     SessionSchema,
     ToolCatalogResponse,
     TokenResponse,
     serialize_analysis,
+    serialize_batch_analysis,
     serialize_detection_metadata,
     serialize_detection_results,
     serialize_engineer,
     serialize_engineers,
     serialize_session,
+    serialize_session_page,
     serialize_sessions,
     serialize_dashboard_metrics,
     serialize_tool_catalog,
 )
-from ..services.session_service import SessionNotFoundError, SessionService
+from ..services.session_service import SessionNotFoundError, SessionService, iter_sessions
 from ..services.dashboard_service import DashboardService
 from ..services.detection_client import DetectionClient, get_detection_client
 from ..services.auth_service import (
@@ -42,12 +63,42 @@ from ..services.auth_service import (
     get_current_engineer,
     require_admin,
 )
-from ..db.models import EngineerORM
-from ..db.session import get_db
-from ..core.config import AppConfig, get_config
+from ..db.session import get_db, readonly_session
+from ..models.engineer import AuthenticatedEngineer
 
 router = APIRouter()
 
+_DEFAULT_PAGE_SIZE = 50
+_MAX_PAGE_SIZE = 200
+_HEALTH_BYTES = b'{"status":"ok"}'
+_ALLOWED_IMAGE_TYPES: frozenset[str] = frozenset({"image/jpeg", "image/png", "image/webp"})
+_MAX_BATCH_IMAGES = 20
+_TOOL_CATALOG_BYTES = orjson.dumps(serialize_tool_catalog().model_dump())
+_TOOL_CATALOG_ETAG = f'"{hashlib.sha256(_TOOL_CATALOG_BYTES).hexdigest()}"'
+# The catalog only changes with a deploy; the ETag lets clients revalidate after that.
+_TOOL_CATALOG_CACHE_CONTROL = "public, max-age=86400"
+_DASHBOARD_CACHE_CONTROL = "private, max-age=5"
+_DETECTION_STATUS_BYTES: WeakKeyDictionary[DetectionClient, bytes] = WeakKeyDictionary()
+
+
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Weak comparison, as RFC 9110 prescribes for If-None-Match."""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    opaque = etag.removeprefix("W/")
+    return any(
+        candidate.strip().removeprefix("W/") == opaque for candidate in if_none_match.split(",")
+    )
+
+
+def _conditional_json(request: Request, body: bytes, etag: str, cache_control: str) -> Response:
+    headers = {"ETag": etag, "Cache-Control": cache_control}
+    if _etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
+
 
 def get_session_service(
     db: Session = Depends(get_db),
@@ -63,17 +114,26 @@ def get_dashboard_service(
 
 
 @router.get("/health", summary="Health check")
-async def healthcheck() -> dict:
-    return {"status": "ok"}
+async def healthcheck() -> Response:
+    # A fresh Response per call: middleware may append to its header list.
+    return Response(content=_HEALTH_BYTES, media_type="application/json")
 
 
-@router.get("/tools", response_model=ToolCatalogResponse, summary="List supported tools")
-async def list_tools() -> ToolCatalogResponse:
-    return serialize_tool_catalog()
+@router.get(
+    "/tools",
+    responses={status.HTTP_200_OK: {"model": ToolCatalogResponse}},
+    summary="List supported tools",
+)
+async def list_tools(request: Request) -> Response:
+    return _conditional_json(
+        request, _TOOL_CATALOG_BYTES, _TOOL_CATALOG_ETAG, _TOOL_CATALOG_CACHE_CONTROL
+    )
 
 
+# Password hashing (argon2) is deliberately slow, so the handlers that hash are
+# plain functions: FastAPI runs them in the threadpool instead of the event loop.
 @router.post("/auth/login", response_model=TokenResponse, summary="Authenticate engineer")
-async def login(
+def login(
     payload: LoginRequest,
     auth_service: AuthService = Depends(get_auth_service),
 ) -> TokenResponse:
@@ -103,22 +163,22 @@ async def logout(
     summary="Get current authenticated engineer profile",
 )
 async def read_current_engineer(
-    engineer: EngineerORM = Depends(get_current_engineer),
+    engineer: AuthenticatedEngineer = Depends(get_current_engineer),
 ) -> EngineerProfileResponse:
     return EngineerProfileResponse(username=engineer.username, role=engineer.role)
 
 
 @router.post(
     "/sessions",
-    response_model=SessionCreateResponse,
     status_code=status.HTTP_201_CREATED,
+    responses={status.HTTP_201_CREATED: {"model": SessionCreateResponse}},
     summary="Create a new hand-out or hand-over session",
 )
 async def create_session(
     request: SessionCreateRequest,
-    engineer: EngineerORM = Depends(get_current_engineer),
+    engineer: AuthenticatedEngineer = Depends(get_current_engineer),
     service: SessionService = Depends(get_session_service),
-) -> SessionCreateResponse:
+) -> ORJSONResponse:
     try:
         session = service.create_session(
             mode=request.mode,
@@ -128,39 +188,93 @@ async def create_session(
         )
     except ValueError as exc:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
-    return SessionCreateResponse(
+    payload = SessionCreateResponse(
         session_id=session.session_id,
         mode=session.mode,
         expected_tool_ids=session.expected_tool_ids,
         threshold=session.threshold,
         engineer_id=session.engineer.id if session.engineer else None,
     )
+    return ORJSONResponse(content=payload.model_dump(), status_code=status.HTTP_201_CREATED)
 
 
 @router.get(
     "/admin/sessions",
-    response_model=SessionListResponse,
+    responses={status.HTTP_200_OK: {"model": Union[SessionListResponse, SessionPageResponse]}},
     summary="List all sessions (admin only)",
 )
 async def admin_list_sessions(
-    _: EngineerORM = Depends(require_admin),
+    limit: Optional[int] = Query(
+        None,
+        ge=1,
+        le=_MAX_PAGE_SIZE,
+        description="Page size; returns session summaries with a `next_cursor`",
+    ),
+    cursor: Optional[str] = Query(None, description="`next_cursor` from the previous page"),
+    _: AuthenticatedEngineer = Depends(require_admin),
     service: SessionService = Depends(get_session_service),
-) -> SessionListResponse:
+) -> Response:
+    if limit is not None or cursor is not None:
+        after = _decode_cursor(cursor) if cursor is not None else None
+        summaries, next_key = service.list_session_page(limit or _DEFAULT_PAGE_SIZE, after)
+        next_cursor = _encode_cursor(next_key) if next_key is not None else None
+        return ORJSONResponse(
+            content=serialize_session_page(summaries, next_cursor).model_dump()
+        )
     sessions = service.list_sessions()
-    return serialize_sessions(sessions)
+    return ORJSONResponse(content=SESSION_LIST_ADAPTER.dump_python(serialize_sessions(sessions)))
+
+
+@router.get(
+    "/admin/sessions/stream",
+    summary="Stream all sessions as NDJSON, one per line (admin only)",
+    response_class=StreamingResponse,
+    responses={status.HTTP_200_OK: {"content": {"application/x-ndjson": {}}}},
+)
+async def admin_stream_sessions(
+    _: AuthenticatedEngineer = Depends(require_admin),
+) -> StreamingResponse:
+    return StreamingResponse(_iter_session_lines(), media_type="application/x-ndjson")
+
+
+def _encode_cursor(key: Tuple[datetime, str]) -> str:
+    created_at, session_id = key
+    raw = orjson.dumps([created_at.isoformat(), session_id])
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode("ascii")
+
+
+def _decode_cursor(cursor: str) -> Tuple[datetime, str]:
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        created_at, session_id = orjson.loads(raw)
+        return datetime.fromisoformat(created_at), str(session_id)
+    except (ValueError, TypeError) as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor") from exc
+
+
+def _iter_session_lines() -> Iterator[bytes]:
+    # Request-scoped sessions are closed before the body is sent, so the
+    # stream opens its own. Starlette runs this generator in a threadpool.
+    with readonly_session() as db:
+        for record in iter_sessions(db):
+            # Encode like ORJSONResponse so both list formats render datetimes alike.
+            yield orjson.dumps(
+                SESSION_ADAPTER.dump_python(serialize_session(record)),
+                option=orjson.OPT_APPEND_NEWLINE,
+            )
 
 
 @router.get(
     "/admin/engineers",
-    response_model=EngineerListResponse,
+    responses={status.HTTP_200_OK: {"model": EngineerListResponse}},
     summary="List all engineers (admin only)",
 )
 async def admin_list_engineers(
-    _: EngineerORM = Depends(require_admin),
+    _: AuthenticatedEngineer = Depends(require_admin),
     auth_service: AuthService = Depends(get_auth_service),
-) -> EngineerListResponse:
+) -> ORJSONResponse:
     engineers = auth_service.list_engineers()
-    return serialize_engineers(engineers)
+    return ORJSONResponse(content=serialize_engineers(engineers).model_dump())
 
 
 @router.post(
@@ -169,9 +283,9 @@ async def admin_list_engineers(
     status_code=status.HTTP_201_CREATED,
     summary="Create a new engineer account (admin only)",
 )
-async def admin_create_engineer(
+def admin_create_engineer(
     payload: EngineerCreateRequest,
-    _: EngineerORM = Depends(require_admin),
+    _: AuthenticatedEngineer = Depends(require_admin),
     auth_service: AuthService = Depends(get_auth_service),
 ) -> EngineerProfileResponse:
     try:
@@ -191,43 +305,42 @@ async def admin_create_engineer(
 
 @router.get(
     "/sessions/{session_id}",
-    response_model=SessionSchema,
+    responses={status.HTTP_200_OK: {"model": SessionSchema}},
     summary="Get session details including past analyses",
 )
 async def get_session(
     session_id: str,
-    engineer: EngineerORM = Depends(get_current_engineer),
+    engineer: AuthenticatedEngineer = Depends(get_current_engineer),
     service: SessionService = Depends(get_session_service),
-) -> SessionSchema:
+) -> ORJSONResponse:
     try:
-        session = service.get_session(session_id)
+        session = service.get_session(
+            session_id, engineer_id=engineer.id, is_admin=engineer.role == "admin"
+        )
     except SessionNotFoundError:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Session not found")
-    if session.engineer and session.engineer.id != engineer.id and engineer.role != "admin":
-        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Not enough privileges")
-    return serialize_session(session)
+    return ORJSONResponse(content=SESSION_ADAPTER.dump_python(serialize_session(session)))
 
 
 @router.post(
     "/sessions/{session_id}/analyse",
-    response_model=AnalysisResponse,
+    responses={status.HTTP_200_OK: {"model": AnalysisResponse}},
     summary="Analyse uploaded image for tool detection",
 )
 async def analyse_image(
     session_id: str,
     file: UploadFile = File(...),
-    engineer: EngineerORM = Depends(get_current_engineer),
+    engineer: AuthenticatedEngineer = Depends(get_current_engineer),
     service: SessionService = Depends(get_session_service),
-) -> AnalysisResponse:
+) -> ORJSONResponse:
     try:
-        session = service.get_session(session_id)
+        session = service.get_session(
+            session_id, engineer_id=engineer.id, is_admin=engineer.role == "admin"
+        )
     except SessionNotFoundError:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Session not found")
-    if session.engineer and session.engineer.id != engineer.id and engineer.role != "admin":
-        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Not enough privileges")
 
-    allowed_media_types = {"image/jpeg", "image/png", "image/webp"}
-    if not file.content_type or file.content_type not in allowed_media_types:
+    if file.content_type not in _ALLOWED_IMAGE_TYPES:
         raise HTTPException(
             status_code=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE,
             detail=f"Unsupported media type '{file.content_type}'.",
@@ -236,70 +349,97 @@ async def analyse_image(
     analysis, updated_session = await service.analyse_image(
         session_id=session.session_id, upload=file
     )
-    return serialize_analysis(updated_session, analysis)
+    return ORJSONResponse(content=serialize_analysis(updated_session, analysis).model_dump())
+
+
+@router.post(
+    "/sessions/{session_id}/analyse/batch",
+    responses={status.HTTP_200_OK: {"model": BatchAnalysisResponse}},
+    summary="Analyse several uploaded images concurrently",
+)
+async def analyse_images(
+    session_id: str,
+    files: List[UploadFile] = File(...),
+    engineer: AuthenticatedEngineer = Depends(get_current_engineer),
+    service: SessionService = Depends(get_session_service),
+) -> ORJSONResponse:
+    try:
+        session = service.get_session(
+            session_id, engineer_id=engineer.id, is_admin=engineer.role == "admin"
+        )
+    except SessionNotFoundError:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Session not found")
+
+    if len(files) > _MAX_BATCH_IMAGES:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"At most {_MAX_BATCH_IMAGES} images per request.",
+        )
+    for file in files:
+        if file.content_type not in _ALLOWED_IMAGE_TYPES:
+            raise HTTPException(
+                status_code=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE,
+                detail=f"Unsupported media type '{file.content_type}'.",
+            )
+
+    analyses, updated_session = await service.analyse_images(
+        session_id=session.session_id, uploads=files
+    )
+    return ORJSONResponse(
+        content=serialize_batch_analysis(updated_session, analyses).model_dump()
+    )
 
 
 @router.get(
     "/admin/dashboard",
-    response_model=DashboardMetricsResponse,
+    responses={status.HTTP_200_OK: {"model": DashboardMetricsResponse}},
     summary="Aggregated metrics for the admin dashboard",
 )
 async def admin_dashboard(
-    _: EngineerORM = Depends(require_admin),
+    request: Request,
+    _: AuthenticatedEngineer = Depends(require_admin),
     service: DashboardService = Depends(get_dashboard_service),
-) -> DashboardMetricsResponse:
+) -> Response:
     metrics = service.collect_metrics()
-    return serialize_dashboard_metrics(metrics)
-
-
-async def _persist_upload_to_path(upload: UploadFile, target_dir: Path) -> Path:
-    target_dir.mkdir(parents=True, exist_ok=True)
-    suffix = Path(upload.filename or "image.jpg").suffix or ".jpg"
-    file_path = target_dir / f"det-{uuid.uuid4()}{suffix}"
-    data = await upload.read()
-    with file_path.open("wb") as file_obj:
-        file_obj.write(data)
-    await upload.seek(0)
-    return file_path
+    body = orjson.dumps(serialize_dashboard_metrics(metrics).model_dump())
+    etag = f'W/"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+    return _conditional_json(request, body, etag, _DASHBOARD_CACHE_CONTROL)
 
 
 @router.post(
     "/vision/detect",
-    response_model=DetectionResponseSchema,
+    responses={status.HTTP_200_OK: {"model": DetectionResponseSchema}},
     summary="Run object detection on an uploaded image",
 )
 async def run_detection(
     file: UploadFile = File(...),
-    engineer: EngineerORM = Depends(get_current_engineer),
+    engineer: AuthenticatedEngineer = Depends(get_current_engineer),
     detection_client: DetectionClient = Depends(get_detection_client),
-    config: AppConfig = Depends(get_config),
-) -> DetectionResponseSchema:
-    supported_types = {"image/jpeg", "image/png", "image/webp"}
-    if file.content_type not in supported_types:
+) -> ORJSONResponse:
+    if file.content_type not in _ALLOWED_IMAGE_TYPES:
         raise HTTPException(
             status_code=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE,
             detail=f"Unsupported media type '{file.content_type}'.",
         )
 
-    temp_path = await _persist_upload_to_path(file, config.upload_dir / "ad-hoc")
-    try:
-        detections = await detection_client.detect(temp_path)
-    finally:
-        try:
-            temp_path.unlink(missing_ok=True)
-        except FileNotFoundError:
-            pass
-    return serialize_detection_results(detections)
+    data = await file.read()
+    detections = await detection_client.detect_bytes(data, file.filename or "image.jpg")
+    return ORJSONResponse(content=serialize_detection_results(detections).model_dump())
 
 
 @router.get(
     "/vision/status",
-    response_model=DetectionMetadataSchema,
+    responses={status.HTTP_200_OK: {"model": DetectionMetadataSchema}},
     summary="Inspect detection backend configuration",
 )
 async def detection_status(
-    _: EngineerORM = Depends(get_current_engineer),
+    _: AuthenticatedEngineer = Depends(get_current_engineer),
     detection_client: DetectionClient = Depends(get_detection_client),
-) -> DetectionMetadataSchema:
-    info = await detection_client.describe()
-    return serialize_detection_metadata(info)
+) -> Response:
+    body = _DETECTION_STATUS_BYTES.get(detection_client)
+    if body is None:
+        # A client's configuration is fixed for its lifetime, so encode it once.
+        info = await detection_client.describe()
+        body = orjson.dumps(serialize_detection_metadata(info).model_dump())
+        _DETECTION_STATUS_BYTES[detection_client] = body
+    return Response(content=body, media_type="application/json")
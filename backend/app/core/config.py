@@ -3,11 +3,27 @@ from __future__ import annotations
 import os
 from functools import lru_cache
 from pathlib import Path
-from typing import List, Optional
+from typing import List, Literal, Optional
 
 from pydantic import BaseModel, Field, HttpUrl, ValidationError
 
 
+class CacheConfig(BaseModel):
+    """Settings for an in-process TTL cache."""
+
+    enabled: bool = Field(default=True, description="Whether the cache is used at all.")
+    max_entries: int = Field(
+        default=10000,
+        ge=1,
+        description="Maximum number of entries kept in the cache.",
+    )
+    ttl_seconds: float = Field(
+        default=30.0,
+        gt=0.0,
+        description="Lifetime of a cache entry in seconds.",
+    )
+
+
 class AppConfig(BaseModel):
     """Runtime configuration for the backend service."""
 
@@ -44,6 +60,30 @@ class AppConfig(BaseModel):
         default=None,
         description="Computation device for YOLO inference (e.g. 'cpu', 'cuda:0').",
     )
+    yolo_max_batch_size: int = Field(
+        default=8,
+        ge=1,
+        le=64,
+        description="Maximum number of queued images passed to one YOLO predict call.",
+    )
+    yolo_export_format: Optional[Literal["engine", "onnx", "openvino"]] = Field(
+        default=None,
+        description=(
+            "Export the weights once to this Ultralytics format (TensorRT 'engine', "
+            "'onnx' or 'openvino') and serve the exported model instead of the .pt file."
+        ),
+    )
+    yolo_precision: Literal["fp32", "fp16", "int8"] = Field(
+        default="fp32",
+        description=(
+            "Inference precision: fp16 runs half precision on CUDA, int8 requires "
+            "yolo_export_format and is calibrated on the dataset from yolo_dataset_config."
+        ),
+    )
+    yolo_compile: bool = Field(
+        default=False,
+        description="Wrap the PyTorch model in torch.compile at startup (CUDA devices only).",
+    )
     upload_dir: Path = Field(
         default=Path("data/uploads"),
         description="Directory where uploaded images are stored.",
@@ -56,6 +96,21 @@ class AppConfig(BaseModel):
         default="sqlite:///data/app.db",
         description="SQLAlchemy database URL (defaults to SQLite file).",
     )
+    db_pool_size: int = Field(
+        default=20,
+        ge=1,
+        description="Persistent connections kept by the pool (non-SQLite databases).",
+    )
+    db_max_overflow: int = Field(
+        default=40,
+        ge=0,
+        description="Extra connections opened above db_pool_size under load.",
+    )
+    db_pool_timeout: float = Field(
+        default=30.0,
+        gt=0.0,
+        description="Seconds to wait for a free pooled connection.",
+    )
     initial_admin_username: str = Field(
         default="admin",
         description="Username for the bootstrap admin account.",
@@ -64,6 +119,10 @@ class AppConfig(BaseModel):
         default="admin123",
         description="Password for the bootstrap admin account.",
     )
+    auth_cache: CacheConfig = Field(
+        default_factory=CacheConfig,
+        description="Cache for resolved bearer tokens.",
+    )
 
     @classmethod
     def from_env(cls) -> "AppConfig":
@@ -74,6 +133,9 @@ class AppConfig(BaseModel):
             "detection_service_url": os.getenv("DETECTION_SERVICE_URL"),
             "detection_timeout_seconds": os.getenv("DETECTION_TIMEOUT_SECONDS"),
             "database_url": os.getenv("DATABASE_URL"),
+            "db_pool_size": os.getenv("DB_POOL_SIZE"),
+            "db_max_overflow": os.getenv("DB_MAX_OVERFLOW"),
+            "db_pool_timeout": os.getenv("DB_POOL_TIMEOUT"),
             "initial_admin_username": os.getenv("INITIAL_ADMIN_USERNAME"),
             "initial_admin_password": os.getenv("INITIAL_ADMIN_PASSWORD"),
             "yolo_model_path": os.getenv("YOLO_MODEL_PATH"),
@@ -81,7 +143,22 @@ class AppConfig(BaseModel):
             "yolo_confidence_threshold": os.getenv("YOLO_CONFIDENCE_THRESHOLD"),
             "yolo_image_size": os.getenv("YOLO_IMAGE_SIZE"),
             "yolo_device": os.getenv("YOLO_DEVICE"),
+            "yolo_max_batch_size": os.getenv("YOLO_MAX_BATCH_SIZE"),
+            "yolo_export_format": os.getenv("YOLO_EXPORT_FORMAT") or None,
+            "yolo_precision": os.getenv("YOLO_PRECISION"),
+            "yolo_compile": os.getenv("YOLO_COMPILE"),
         }
+        auth_cache = {
+            key: value
+            for key, value in {
+                "enabled": os.getenv("AUTH_CACHE_ENABLED"),
+                "max_entries": os.getenv("AUTH_CACHE_MAX_ENTRIES"),
+                "ttl_seconds": os.getenv("AUTH_CACHE_TTL_SECONDS"),
+            }.items()
+            if value is not None
+        }
+        if auth_cache:
+            data["auth_cache"] = auth_cache
         if raw_upload_dir:
             data["upload_dir"] = Path(raw_upload_dir)
         if raw_allowed_origins:
@@ -90,24 +167,25 @@ class AppConfig(BaseModel):
                 for item in raw_allowed_origins.split(",")
                 if item.strip()
             ]
-        config = cls.parse_obj(data)
-        config.upload_dir.mkdir(parents=True, exist_ok=True)
-        if config.database_url.startswith("sqlite"):
-            db_path = config.database_url.split("sqlite:///")[-1]
+        # Unset variables fall back to the field defaults instead of failing validation.
+        return cls.model_validate({key: value for key, value in data.items() if value is not None})
+
+    def ensure_runtime_dirs(self) -> None:
+        """Create the upload directory and the SQLite database directory."""
+        self.upload_dir.mkdir(parents=True, exist_ok=True)
+        if self.database_url.startswith("sqlite"):
+            db_path = self.database_url.split("sqlite:///")[-1]
             if db_path:
                 Path(db_path).expanduser().resolve(strict=False).parent.mkdir(
                     parents=True, exist_ok=True
                 )
-        return config
 
 
-@lru_cache
+@lru_cache(maxsize=1)
 def get_config() -> AppConfig:
     """Return cached application configuration."""
     try:
         return AppConfig.from_env()
     except ValidationError:
-        # In case of invalid env config, fall back to defaults while keeping directory creation.
-        config = AppConfig()
-        config.upload_dir.mkdir(parents=True, exist_ok=True)
-        return config
+        # In case of invalid env config, fall back to defaults.
+        return AppConfig()
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Dict, List
+from typing import Dict, FrozenSet, Iterable, List, Tuple
 
 
 @dataclass(frozen=True)
@@ -41,5 +41,23 @@ DEFAULT_TOOLS: List[ToolDefinition] = [
 TOOL_LOOKUP: Dict[str, ToolDefinition] = {tool.tool_id: tool for tool in DEFAULT_TOOLS}
 
 
+# Bit positions are persisted in the database: only ever append to DEFAULT_TOOLS.
+TOOL_BIT: Dict[str, int] = {tool_id: 1 << index for index, tool_id in enumerate(TOOL_LOOKUP)}
+
+_DEFAULT_TOOL_ID_TUPLE: Tuple[str, ...] = tuple(TOOL_LOOKUP)
+TOOL_ID_SET: FrozenSet[str] = frozenset(TOOL_LOOKUP)
+
+
 def get_default_tool_ids() -> List[str]:
-    return [tool.tool_id for tool in DEFAULT_TOOLS]
+    return list(_DEFAULT_TOOL_ID_TUPLE)
+
+
+def tool_ids_to_mask(tool_ids: Iterable[str]) -> int:
+    mask = 0
+    for tool_id in tool_ids:
+        mask |= TOOL_BIT.get(tool_id, 0)
+    return mask
+
+
+def mask_to_tool_ids(mask: int) -> List[str]:
+    return [tool_id for tool_id, bit in TOOL_BIT.items() if mask & bit]
@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+import json
+import logging
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy import inspect, text
+from sqlalchemy.engine import Connection, Engine
+
+from ..core.tool_catalog import tool_ids_to_mask
+
+logger = logging.getLogger(__name__)
+
+# table -> (primary key, {legacy JSON list column: bitmask column})
+_TOOL_MASK_COLUMNS: Dict[str, Tuple[str, Dict[str, str]]] = {
+    "sessions": ("session_id", {"expected_tool_ids": "expected_tool_mask"}),
+    "analyses": (
+        "id",
+        {"matched_tool_ids": "matched_tool_mask", "missing_tool_ids": "missing_tool_mask"},
+    ),
+}
+
+
+def upgrade_schema(engine: Engine) -> None:
+    """Bring tables created by older releases in line with the current models.
+
+    Runs before ``create_all`` so that tables dropped here are recreated with
+    the current definition.
+    """
+    inspector = inspect(engine)
+    tables = set(inspector.get_table_names())
+
+    if "engineer_tokens" in tables:
+        columns = {column["name"] for column in inspector.get_columns("engineer_tokens")}
+        if "token_hash" not in columns:
+            # Raw tokens cannot be hashed retroactively in a useful way and are
+            # short-lived anyway; engineers simply log in again.
+            logger.info("Recreating engineer_tokens with hashed token storage")
+            with engine.begin() as connection:
+                connection.exec_driver_sql("DROP TABLE engineer_tokens")
+
+    for table, (key_column, renames) in _TOOL_MASK_COLUMNS.items():
+        if table not in tables:
+            continue
+        columns = {column["name"] for column in inspector.get_columns(table)}
+        legacy = {old: new for old, new in renames.items() if old in columns}
+        if legacy:
+            logger.info("Converting %s tool id lists to bitmasks", table)
+            with engine.begin() as connection:
+                _convert_tool_lists(connection, table, key_column, legacy, columns)
+
+
+def _convert_tool_lists(
+    connection: Connection,
+    table: str,
+    key_column: str,
+    renames: Dict[str, str],
+    existing_columns: Iterable[str],
+) -> None:
+    for new in renames.values():
+        if new not in existing_columns:
+            connection.exec_driver_sql(
+                f"ALTER TABLE {table} ADD COLUMN {new} BIGINT NOT NULL DEFAULT 0"
+            )
+
+    old_columns = list(renames)
+    rows = connection.exec_driver_sql(
+        f"SELECT {key_column}, {', '.join(old_columns)} FROM {table}"
+    ).all()
+    assignments = ", ".join(f"{new} = :{new}" for new in renames.values())
+    update = text(f"UPDATE {table} SET {assignments} WHERE {key_column} = :key")
+    for row in rows:
+        params = {
+            new: tool_ids_to_mask(_load_id_list(row[index + 1]))
+            for index, new in enumerate(renames.values())
+        }
+        params["key"] = row[0]
+        connection.execute(update, params)
+
+    for old in old_columns:
+        connection.exec_driver_sql(f"ALTER TABLE {table} DROP COLUMN {old}")
+
+
+def _load_id_list(value: Optional[object]) -> List[str]:
+    if isinstance(value, str):
+        value = json.loads(value)
+    return list(value or [])
@@ -1,23 +1,62 @@
 from __future__ import annotations
 
-from datetime import datetime
+from datetime import datetime, timezone
+from functools import partial
 from typing import List, Optional
 
-from sqlalchemy import Boolean, DateTime, Float, ForeignKey, Integer, JSON, String
+from sqlalchemy import (
+    BigInteger,
+    Boolean,
+    DateTime,
+    Float,
+    ForeignKey,
+    Index,
+    Integer,
+    JSON,
+    LargeBinary,
+    String,
+)
 from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy.types import TypeDecorator
 
 from .base import Base
 
+_utcnow = partial(datetime.now, timezone.utc)
+
+
+class UTCDateTime(TypeDecorator):
+    """Timezone-aware UTC datetimes on top of a plain ``DateTime`` column.
+
+    Values are stored as naive UTC, which keeps the column type unchanged, and
+    come back tagged with ``timezone.utc`` even on backends like SQLite that
+    drop the offset.
+    """
+
+    impl = DateTime
+    cache_ok = True
+
+    def process_bind_param(self, value: Optional[datetime], dialect) -> Optional[datetime]:
+        if value is not None and value.tzinfo is not None:
+            value = value.astimezone(timezone.utc).replace(tzinfo=None)
+        return value
+
+    def process_result_value(self, value: Optional[datetime], dialect) -> Optional[datetime]:
+        if value is not None and value.tzinfo is None:
+            value = value.replace(tzinfo=timezone.utc)
+        return value
+
 
 class SessionORM(Base):
     __tablename__ = "sessions"
+    # Keyset pagination walks sessions newest first by (created_at, session_id).
+    __table_args__ = (Index("ix_sessions_created_id", "created_at", "session_id"),)
 
     session_id: Mapped[str] = mapped_column(String(36), primary_key=True)
     mode: Mapped[str] = mapped_column(String(20), nullable=False)
-    expected_tool_ids: Mapped[List[str]] = mapped_column(JSON, nullable=False, default=list)
+    expected_tool_mask: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0)
     threshold: Mapped[float] = mapped_column(Float, nullable=False)
     status: Mapped[str] = mapped_column(String(20), nullable=False, default="pending")
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, nullable=False)
+    created_at: Mapped[datetime] = mapped_column(UTCDateTime, default=_utcnow, nullable=False)
     engineer_id: Mapped[Optional[int]] = mapped_column(
         Integer,
         ForeignKey("engineers.id", ondelete="SET NULL"),
@@ -28,13 +67,14 @@ class SessionORM(Base):
         back_populates="session",
         cascade="all, delete-orphan",
         order_by="AnalysisORM.created_at",
-        lazy="joined",
+        lazy="selectin",
     )
-    engineer: Mapped[Optional["EngineerORM"]] = relationship(lazy="joined")
+    engineer: Mapped[Optional["EngineerORM"]] = relationship(lazy="selectin")
 
 
 class AnalysisORM(Base):
     __tablename__ = "analyses"
+    __table_args__ = (Index("ix_analyses_session_created", "session_id", "created_at"),)
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     request_id: Mapped[str] = mapped_column(String(36), unique=True, nullable=False, index=True)
@@ -43,12 +83,12 @@ class AnalysisORM(Base):
     )
     image_filename: Mapped[str] = mapped_column(String(255), nullable=False)
     detected: Mapped[List[dict]] = mapped_column(JSON, nullable=False, default=list)
-    matched_tool_ids: Mapped[List[str]] = mapped_column(JSON, nullable=False, default=list)
-    missing_tool_ids: Mapped[List[str]] = mapped_column(JSON, nullable=False, default=list)
+    matched_tool_mask: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0)
+    missing_tool_mask: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0)
     unexpected_labels: Mapped[List[str]] = mapped_column(JSON, nullable=False, default=list)
     match_ratio: Mapped[float] = mapped_column(Float, nullable=False)
     below_threshold: Mapped[bool] = mapped_column(Boolean, nullable=False)
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, nullable=False)
+    created_at: Mapped[datetime] = mapped_column(UTCDateTime, default=_utcnow, nullable=False)
 
     session: Mapped[SessionORM] = relationship(back_populates="analyses")
 
@@ -60,7 +100,7 @@ class EngineerORM(Base):
     username: Mapped[str] = mapped_column(String(64), unique=True, nullable=False, index=True)
     password_hash: Mapped[str] = mapped_column(String(255), nullable=False)
     role: Mapped[str] = mapped_column(String(32), nullable=False, default="engineer")
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, nullable=False)
+    created_at: Mapped[datetime] = mapped_column(UTCDateTime, default=_utcnow, nullable=False)
 
     tokens: Mapped[List["EngineerTokenORM"]] = relationship(
         back_populates="engineer", cascade="all, delete-orphan"
@@ -71,8 +111,10 @@ class EngineerTokenORM(Base):
     __tablename__ = "engineer_tokens"
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
-    token: Mapped[str] = mapped_column(String(128), unique=True, nullable=False, index=True)
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, nullable=False)
+    token_hash: Mapped[bytes] = mapped_column(
+        LargeBinary(32), unique=True, nullable=False, index=True
+    )
+    created_at: Mapped[datetime] = mapped_column(UTCDateTime, default=_utcnow, nullable=False)
     engineer_id: Mapped[int] = mapped_column(Integer, ForeignKey("engineers.id", ondelete="CASCADE"))
 
     engineer: Mapped[EngineerORM] = relationship(back_populates="tokens")
@@ -3,14 +3,56 @@ from __future__ import annotations
 from contextlib import contextmanager
 from typing import Generator
 
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import StaticPool
 
 from ..core.config import get_config
 from .base import Base
+from .migrations import upgrade_schema
 
 _ENGINE = None
-SessionLocal: sessionmaker[Session] | None = None
+# Bound to the engine by init_db() during application startup; request-time
+# helpers use it directly instead of going through a lazy accessor.
+SessionLocal: sessionmaker[Session] = sessionmaker(
+    autocommit=False,
+    autoflush=False,
+    expire_on_commit=False,
+    class_=Session,
+)
+
+
+_SQLITE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",
+)
+# Recycle server-side connections before typical idle timeouts drop them.
+_POOL_RECYCLE_SECONDS = 1800
+
+
+def _apply_sqlite_pragmas(dbapi_connection, _connection_record) -> None:
+    cursor = dbapi_connection.cursor()
+    try:
+        for pragma in _SQLITE_PRAGMAS:
+            cursor.execute(pragma)
+    finally:
+        cursor.close()
+
+
+def _create_sqlite_engine(database_url: str):
+    # File databases keep SQLAlchemy's default QueuePool rather than NullPool:
+    # opening a SQLite connection is cheap, but re-running the PRAGMAs above on
+    # every checkout is not free, and WAL lets pooled connections read
+    # concurrently.
+    engine_kwargs = {"connect_args": {"check_same_thread": False}}
+    if database_url in {"sqlite://", "sqlite:///:memory:"}:
+        # Every new connection would see a different in-memory database.
+        engine_kwargs["poolclass"] = StaticPool
+    engine = create_engine(database_url, future=True, echo=False, **engine_kwargs)
+    event.listen(engine, "connect", _apply_sqlite_pragmas)
+    return engine
 
 
 def get_engine():
@@ -18,28 +60,38 @@ def get_engine():
     if _ENGINE is None:
         config = get_config()
         database_url = config.database_url
-        connect_args = {"check_same_thread": False} if database_url.startswith("sqlite") else {}
-        _ENGINE = create_engine(database_url, future=True, echo=False, connect_args=connect_args)
+        if database_url.startswith("sqlite"):
+            _ENGINE = _create_sqlite_engine(database_url)
+        else:
+            _ENGINE = create_engine(
+                database_url,
+                future=True,
+                echo=False,
+                pool_pre_ping=True,
+                pool_size=config.db_pool_size,
+                max_overflow=config.db_max_overflow,
+                pool_timeout=config.db_pool_timeout,
+                pool_recycle=_POOL_RECYCLE_SECONDS,
+            )
     return _ENGINE
 
 
-def get_session_factory() -> sessionmaker[Session]:
-    global SessionLocal
-    if SessionLocal is None:
-        SessionLocal = sessionmaker(bind=get_engine(), autocommit=False, autoflush=False, class_=Session)
-    return SessionLocal
-
-
 def init_db() -> None:
-    """Create database tables if they don't exist."""
+    """Create database tables and indexes if they don't exist, and bind ``SessionLocal``."""
     engine = get_engine()
+    SessionLocal.configure(bind=engine)
+    upgrade_schema(engine)
     Base.metadata.create_all(bind=engine)
+    # create_all() skips tables that already exist, so indexes added to
+    # existing models later have to be created separately.
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(bind=engine, checkfirst=True)
 
 
 @contextmanager
 def session_scope() -> Generator[Session, None, None]:
-    factory = get_session_factory()
-    db = factory()
+    db = SessionLocal()
     try:
         yield db
         db.commit()
@@ -50,9 +102,19 @@ def session_scope() -> Generator[Session, None, None]:
         db.close()
 
 
+@contextmanager
+def readonly_session() -> Generator[Session, None, None]:
+    """Like ``session_scope`` but never commits; for code paths that only read."""
+    db = SessionLocal()
+    try:
+        yield db
+    finally:
+        # Closing rolls back the open transaction, if any, without a COMMIT.
+        db.close()
+
+
 def get_db() -> Generator[Session, None, None]:
-    factory = get_session_factory()
-    db = factory()
+    db = SessionLocal()
     try:
         yield db
     finally:
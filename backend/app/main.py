@@ -1,23 +1,50 @@
 from __future__ import annotations
 
+import asyncio
+from contextlib import asynccontextmanager
 from pathlib import Path
+from typing import AsyncIterator
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import FileResponse
+from fastapi.responses import FileResponse, ORJSONResponse
 from fastapi.staticfiles import StaticFiles
+from starlette.middleware.authentication import AuthenticationMiddleware
 
+from .api.cors import WildcardCORSMiddleware
 from .api.routes import router as api_router
 from .core.config import get_config
 from .db.session import init_db
-from .services.auth_service import ensure_initial_admin
+from .services.auth_service import BearerTokenBackend, ensure_initial_admin
+from .services.detection_client import close_detection_client, get_detection_client
+
+
+@asynccontextmanager
+async def lifespan(_: FastAPI) -> AsyncIterator[None]:
+    get_config().ensure_runtime_dirs()
+    init_db()
+    ensure_initial_admin()
+    # Load the detector in the background so startup does not wait for it.
+    warmup = asyncio.create_task(get_detection_client().warmup())
+    yield
+    warmup.cancel()
+    await close_detection_client()
 
 
 def create_app() -> FastAPI:
     config = get_config()
-    app = FastAPI(title=config.app_name)
+    app = FastAPI(
+        title=config.app_name,
+        lifespan=lifespan,
+        default_response_class=ORJSONResponse,
+        redirect_slashes=False,
+    )
 
-    if config.allowed_origins:
+    # Added before CORS so that CORS stays the outermost middleware.
+    app.add_middleware(AuthenticationMiddleware, backend=BearerTokenBackend())
+    if config.allowed_origins == ["*"]:
+        app.add_middleware(WildcardCORSMiddleware)
+    elif config.allowed_origins:
         app.add_middleware(
             CORSMiddleware,
             allow_origins=config.allowed_origins,
@@ -28,11 +55,6 @@ def create_app() -> FastAPI:
 
     app.include_router(api_router, prefix="/api")
 
-    @app.on_event("startup")
-    async def on_startup() -> None:
-        init_db()
-        ensure_initial_admin()
-
     frontend_dir = Path(__file__).resolve().parents[2] / "frontend"
     if frontend_dir.exists():
         app.mount("/static", StaticFiles(directory=frontend_dir), name="static")
@@ -0,0 +1,24 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+from starlette.authentication import BaseUser
+
+
+@dataclass(frozen=True)
+class AuthenticatedEngineer(BaseUser):
+    id: int
+    username: str
+    role: str
+
+    @property
+    def is_authenticated(self) -> bool:
+        return True
+
+    @property
+    def display_name(self) -> str:
+        return self.username
+
+    @property
+    def identity(self) -> str:
+        return str(self.id)
@@ -1,7 +1,8 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from datetime import datetime
+from datetime import datetime, timezone
+from functools import partial
 from enum import Enum
 from typing import List, Optional
 
@@ -16,20 +17,20 @@ class SessionStatus(str, Enum):
     COMPLETED = "completed"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class SessionEngineer:
     id: int
     username: str
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class DetectionItem:
     tool_id: Optional[str]
     label: str
     confidence: float
 
 
-@dataclass
+@dataclass(slots=True)
 class AnalysisSnapshot:
     request_id: str
     image_filename: str
@@ -39,16 +40,16 @@ class AnalysisSnapshot:
     unexpected_labels: List[str]
     match_ratio: float
     below_threshold: bool
-    created_at: datetime = field(default_factory=datetime.utcnow)
+    created_at: datetime = field(default_factory=partial(datetime.now, timezone.utc))
 
 
-@dataclass
+@dataclass(slots=True)
 class SessionRecord:
     session_id: str
     mode: SessionMode
     expected_tool_ids: List[str]
     threshold: float
-    created_at: datetime = field(default_factory=datetime.utcnow)
+    created_at: datetime = field(default_factory=partial(datetime.now, timezone.utc))
     status: SessionStatus = SessionStatus.PENDING
     analyses: List[AnalysisSnapshot] = field(default_factory=list)
     engineer: Optional[SessionEngineer] = None
@@ -60,3 +61,17 @@ class SessionRecord:
         if not self.analyses:
             return None
         return self.analyses[-1]
+
+
+@dataclass(slots=True)
+class SessionSummary:
+    """List view of a session: top-level fields plus the latest analysis only."""
+
+    session_id: str
+    mode: SessionMode
+    expected_tool_ids: List[str]
+    threshold: float
+    created_at: datetime
+    status: SessionStatus
+    engineer: Optional[SessionEngineer] = None
+    latest_analysis: Optional[AnalysisSnapshot] = None
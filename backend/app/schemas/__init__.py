@@ -0,0 +1,79 @@
+from .request import EngineerCreateRequest, LoginRequest, SessionCreateRequest
+from .response import (
+    AnalysisResponse,
+    AnalysisSnapshotSchema,
+    BatchAnalysisResponse,
+    DashboardMetricsResponse,
+    DashboardModeStat,
+    DashboardSessionSummarySchema,
+    DetectionItemSchema,
+    DetectionMetadataSchema,
+    DetectionResponseSchema,
+    EngineerListResponse,
+    EngineerProfileResponse,
+    EngineerSummary,
+    ResponseSchema,
+    SESSION_ADAPTER,
+    SESSION_LIST_ADAPTER,
+    SessionCreateResponse,
+    SessionEngineerSchema,
+    SessionListResponse,
+    SessionPageResponse,
+    SessionSchema,
+    SessionSummarySchema,
+    TokenResponse,
+    ToolCatalogResponse,
+    ToolSchema,
+    serialize_analysis,
+    serialize_batch_analysis,
+    serialize_dashboard_metrics,
+    serialize_detection_metadata,
+    serialize_detection_results,
+    serialize_engineer,
+    serialize_engineers,
+    serialize_session,
+    serialize_session_page,
+    serialize_sessions,
+    serialize_tool_catalog,
+)
+
+__all__ = [
+    "AnalysisResponse",
+    "AnalysisSnapshotSchema",
+    "BatchAnalysisResponse",
+    "DashboardMetricsResponse",
+    "DashboardModeStat",
+    "DashboardSessionSummarySchema",
+    "DetectionItemSchema",
+    "DetectionMetadataSchema",
+    "DetectionResponseSchema",
+    "EngineerCreateRequest",
+    "EngineerListResponse",
+    "EngineerProfileResponse",
+    "EngineerSummary",
+    "LoginRequest",
+    "ResponseSchema",
+    "SESSION_ADAPTER",
+    "SESSION_LIST_ADAPTER",
+    "SessionCreateRequest",
+    "SessionCreateResponse",
+    "SessionEngineerSchema",
+    "SessionListResponse",
+    "SessionPageResponse",
+    "SessionSchema",
+    "SessionSummarySchema",
+    "TokenResponse",
+    "ToolCatalogResponse",
+    "ToolSchema",
+    "serialize_analysis",
+    "serialize_batch_analysis",
+    "serialize_dashboard_metrics",
+    "serialize_detection_metadata",
+    "serialize_detection_results",
+    "serialize_engineer",
+    "serialize_engineers",
+    "serialize_session",
+    "serialize_session_page",
+    "serialize_sessions",
+    "serialize_tool_catalog",
+]
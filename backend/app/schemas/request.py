@@ -0,0 +1,41 @@
+from __future__ import annotations
+
+from typing import List, Optional
+
+from pydantic import BaseModel, Field, field_validator
+
+from ..core.tool_catalog import TOOL_ID_SET
+from ..models.session import SessionMode
+
+
+class SessionCreateRequest(BaseModel):
+    mode: SessionMode
+    expected_tool_ids: Optional[List[str]] = None
+    threshold: float = Field(default=0.9, ge=0.0, le=1.0)
+
+    @field_validator("expected_tool_ids")
+    @classmethod
+    def validate_tool_ids(cls, value: Optional[List[str]]) -> Optional[List[str]]:
+        unknown = [tool_id for tool_id in value or () if tool_id not in TOOL_ID_SET]
+        if unknown:
+            raise ValueError("Unknown tool_id " + ", ".join(f"'{tool_id}'" for tool_id in unknown))
+        return value
+
+
+class LoginRequest(BaseModel):
+    username: str = Field(..., min_length=1)
+    password: str = Field(..., min_length=1)
+
+
+class EngineerCreateRequest(BaseModel):
+    username: str = Field(..., min_length=3)
+    password: str = Field(..., min_length=6)
+    role: str = Field(default="engineer")
+
+    @field_validator("role")
+    @classmethod
+    def validate_role(cls, value: str) -> str:
+        normalized = value.strip().lower()
+        if normalized not in {"admin", "engineer"}:
+            raise ValueError("Role must be 'admin' or 'engineer'")
+        return normalized
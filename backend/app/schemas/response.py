@@ -0,0 +1,334 @@
+from __future__ import annotations
+
+from datetime import datetime
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Sequence, Union
+
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
+from sqlalchemy import Row
+
+from ..core.tool_catalog import DEFAULT_TOOLS
+from ..models.session import (
+    AnalysisSnapshot,
+    DetectionItem,
+    SessionEngineer,
+    SessionMode,
+    SessionRecord,
+    SessionStatus,
+    SessionSummary,
+)
+from ..services.dashboard_service import DashboardMetrics
+from ..services.detection_client import DetectionBackendInfo
+from ..db.models import EngineerORM
+
+
+class ResponseSchema(BaseModel):
+    """Base for outbound schemas: built from trusted data and never mutated."""
+
+    model_config = ConfigDict(frozen=True, revalidate_instances="never")
+
+
+class ToolSchema(ResponseSchema):
+    tool_id: str
+    name: str
+    description: str
+
+
+class DetectionItemSchema(ResponseSchema):
+    tool_id: Optional[str]
+    label: str
+    confidence: float
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class DetectionResponseSchema(ResponseSchema):
+    detections: List[DetectionItemSchema]
+
+
+class DetectionMetadataSchema(ResponseSchema):
+    backend: str
+    configured: bool
+    details: Dict[str, Any] = Field(default_factory=dict)
+    classes: List[str] = Field(default_factory=list)
+
+
+class AnalysisSnapshotSchema(ResponseSchema):
+    request_id: str
+    image_filename: str
+    detected: List[DetectionItemSchema]
+    matched_tool_ids: List[str]
+    missing_tool_ids: List[str]
+    unexpected_labels: List[str]
+    match_ratio: float
+    below_threshold: bool
+    created_at: datetime
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class SessionEngineerSchema(ResponseSchema):
+    id: int
+    username: str
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class SessionSchema(ResponseSchema):
+    session_id: str
+    mode: SessionMode
+    expected_tool_ids: List[str]
+    threshold: float
+    created_at: datetime
+    status: SessionStatus
+    analyses: List[AnalysisSnapshotSchema] = Field(default_factory=list)
+    engineer: Optional[SessionEngineerSchema] = None
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class DashboardModeStat(ResponseSchema):
+    mode: SessionMode
+    count: int
+
+
+class DashboardSessionSummarySchema(ResponseSchema):
+    session_id: str
+    created_at: datetime
+    status: SessionStatus
+    engineer_id: Optional[int] = None
+    engineer_username: Optional[str] = None
+
+
+class DashboardMetricsResponse(ResponseSchema):
+    total_sessions: int
+    pending_sessions: int
+    completed_sessions: int
+    total_engineers: int
+    total_analyses: int
+    sessions_by_mode: List[DashboardModeStat]
+    latest_sessions: List[DashboardSessionSummarySchema]
+
+
+class SessionCreateResponse(ResponseSchema):
+    session_id: str
+    mode: SessionMode
+    expected_tool_ids: List[str]
+    threshold: float
+    engineer_id: Optional[int] = None
+
+
+class AnalysisResponse(ResponseSchema):
+    session_id: str
+    session_status: SessionStatus
+    analysis: AnalysisSnapshotSchema
+
+
+class BatchAnalysisResponse(ResponseSchema):
+    session_id: str
+    session_status: SessionStatus
+    analyses: List[AnalysisSnapshotSchema]
+
+
+class ToolCatalogResponse(ResponseSchema):
+    tools: List[ToolSchema]
+
+
+class TokenResponse(ResponseSchema):
+    access_token: str
+    token_type: str = "bearer"
+    username: str
+    role: str
+
+
+class EngineerProfileResponse(ResponseSchema):
+    username: str
+    role: str
+
+
+class SessionListResponse(ResponseSchema):
+    sessions: List[SessionSchema]
+
+
+class SessionSummarySchema(ResponseSchema):
+    session_id: str
+    mode: SessionMode
+    expected_tool_ids: List[str]
+    threshold: float
+    created_at: datetime
+    status: SessionStatus
+    engineer: Optional[SessionEngineerSchema] = None
+    latest_analysis: Optional[AnalysisSnapshotSchema] = None
+
+
+class SessionPageResponse(ResponseSchema):
+    sessions: List[SessionSummarySchema]
+    next_cursor: Optional[str] = None
+
+
+class EngineerSummary(ResponseSchema):
+    username: str
+    role: str
+    created_at: datetime
+
+
+class EngineerListResponse(ResponseSchema):
+    engineers: List[EngineerSummary]
+
+
+SESSION_ADAPTER = TypeAdapter(SessionSchema)
+SESSION_LIST_ADAPTER = TypeAdapter(SessionListResponse)
+
+
+@lru_cache(maxsize=1)
+def serialize_tool_catalog() -> ToolCatalogResponse:
+    return ToolCatalogResponse(
+        tools=[
+            ToolSchema(tool_id=tool.tool_id, name=tool.name, description=tool.description)
+            for tool in DEFAULT_TOOLS
+        ]
+    )
+
+
+# Serializers below wrap data produced by our own services and ORM rows, so
+# they use ``model_construct`` and skip validation. Inbound data is validated
+# by the models in ``request.py``.
+
+
+def _construct_detection(item: DetectionItem) -> DetectionItemSchema:
+    return DetectionItemSchema.model_construct(
+        tool_id=item.tool_id, label=item.label, confidence=item.confidence
+    )
+
+
+def _construct_analysis(analysis: AnalysisSnapshot) -> AnalysisSnapshotSchema:
+    return AnalysisSnapshotSchema.model_construct(
+        request_id=analysis.request_id,
+        image_filename=analysis.image_filename,
+        detected=[_construct_detection(item) for item in analysis.detected],
+        matched_tool_ids=analysis.matched_tool_ids,
+        missing_tool_ids=analysis.missing_tool_ids,
+        unexpected_labels=analysis.unexpected_labels,
+        match_ratio=analysis.match_ratio,
+        below_threshold=analysis.below_threshold,
+        created_at=analysis.created_at,
+    )
+
+
+def _construct_engineer(engineer: Optional[SessionEngineer]) -> Optional[SessionEngineerSchema]:
+    if engineer is None:
+        return None
+    return SessionEngineerSchema.model_construct(id=engineer.id, username=engineer.username)
+
+
+def serialize_session(session: SessionRecord) -> SessionSchema:
+    return SessionSchema.model_construct(
+        session_id=session.session_id,
+        mode=session.mode,
+        expected_tool_ids=session.expected_tool_ids,
+        threshold=session.threshold,
+        created_at=session.created_at,
+        status=session.status,
+        analyses=[_construct_analysis(analysis) for analysis in session.analyses],
+        engineer=_construct_engineer(session.engineer),
+    )
+
+
+def serialize_sessions(sessions: List[SessionRecord]) -> SessionListResponse:
+    return SessionListResponse.model_construct(
+        sessions=[serialize_session(session) for session in sessions]
+    )
+
+
+def serialize_session_page(
+    summaries: List[SessionSummary], next_cursor: Optional[str]
+) -> SessionPageResponse:
+    return SessionPageResponse.model_construct(
+        sessions=[
+            SessionSummarySchema.model_construct(
+                session_id=summary.session_id,
+                mode=summary.mode,
+                expected_tool_ids=summary.expected_tool_ids,
+                threshold=summary.threshold,
+                created_at=summary.created_at,
+                status=summary.status,
+                engineer=_construct_engineer(summary.engineer),
+                latest_analysis=(
+                    _construct_analysis(summary.latest_analysis)
+                    if summary.latest_analysis is not None
+                    else None
+                ),
+            )
+            for summary in summaries
+        ],
+        next_cursor=next_cursor,
+    )
+
+
+def serialize_analysis(session: SessionRecord, analysis: AnalysisSnapshot) -> AnalysisResponse:
+    return AnalysisResponse.model_construct(
+        session_id=session.session_id,
+        session_status=session.status,
+        analysis=_construct_analysis(analysis),
+    )
+
+
+def serialize_batch_analysis(
+    session: SessionRecord, analyses: List[AnalysisSnapshot]
+) -> BatchAnalysisResponse:
+    return BatchAnalysisResponse.model_construct(
+        session_id=session.session_id,
+        session_status=session.status,
+        analyses=[_construct_analysis(analysis) for analysis in analyses],
+    )
+
+
+def serialize_engineer(engineer: Union[EngineerORM, Row]) -> EngineerSummary:
+    return EngineerSummary.model_construct(
+        username=engineer.username, role=engineer.role, created_at=engineer.created_at
+    )
+
+
+def serialize_engineers(engineers: Sequence[Union[EngineerORM, Row]]) -> EngineerListResponse:
+    return EngineerListResponse.model_construct(
+        engineers=[serialize_engineer(engineer) for engineer in engineers]
+    )
+
+
+def serialize_dashboard_metrics(metrics: DashboardMetrics) -> DashboardMetricsResponse:
+    return DashboardMetricsResponse.model_construct(
+        total_sessions=metrics.total_sessions,
+        pending_sessions=metrics.pending_sessions,
+        completed_sessions=metrics.completed_sessions,
+        total_engineers=metrics.total_engineers,
+        total_analyses=metrics.total_analyses,
+        sessions_by_mode=[
+            DashboardModeStat.model_construct(mode=item.mode, count=item.count)
+            for item in metrics.sessions_by_mode
+        ],
+        latest_sessions=[
+            DashboardSessionSummarySchema.model_construct(
+                session_id=session.session_id,
+                created_at=session.created_at,
+                status=session.status,
+                engineer_id=session.engineer_id,
+                engineer_username=session.engineer_username,
+            )
+            for session in metrics.latest_sessions
+        ],
+    )
+
+
+def serialize_detection_results(detections) -> DetectionResponseSchema:
+    return DetectionResponseSchema.model_construct(
+        detections=[_construct_detection(item) for item in detections]
+    )
+
+
+def serialize_detection_metadata(info: DetectionBackendInfo) -> DetectionMetadataSchema:
+    return DetectionMetadataSchema(
+        backend=info.backend,
+        configured=info.configured,
+        details=info.details,
+        classes=info.classes,
+    )
@@ -1,52 +1,132 @@
 from __future__ import annotations
 
 import hashlib
+import hmac
 import secrets
-from typing import Optional
+import threading
+from functools import lru_cache
+from datetime import datetime
+from typing import Optional, Sequence, Tuple
 
-from fastapi import Depends, HTTPException, status
+from argon2 import PasswordHasher
+from argon2.exceptions import InvalidHashError, VerificationError
+from cachetools import TTLCache
+from fastapi import Depends, HTTPException, Request, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
-from sqlalchemy import delete, select
-from sqlalchemy.orm import Session, selectinload
+from sqlalchemy import Row, delete, select
+from starlette.authentication import AuthCredentials, AuthenticationBackend
+from starlette.concurrency import run_in_threadpool
+from starlette.requests import HTTPConnection
+from sqlalchemy.orm import Session
 
 from ..core.config import get_config
 from ..db.models import EngineerORM, EngineerTokenORM
-from ..db.session import get_db, session_scope
+from ..db.session import get_db, readonly_session, session_scope
+from ..models.engineer import AuthenticatedEngineer
 
 
 VALID_ROLES = {"admin", "engineer"}
 
 
+_password_hasher = PasswordHasher()
+_ARGON2_PREFIX = "$argon2"
+
+
 def _hash_password(raw_password: str) -> str:
-    return hashlib.sha256(raw_password.encode("utf-8")).hexdigest()
+    return _password_hasher.hash(raw_password)
+
+
+def _verify_password(password_hash: str, raw_password: str) -> bool:
+    if not password_hash.startswith(_ARGON2_PREFIX):
+        # Accounts created before the switch to argon2 store an unsalted SHA-256 hex digest.
+        legacy_hash = hashlib.sha256(raw_password.encode("utf-8")).hexdigest()
+        return hmac.compare_digest(password_hash, legacy_hash)
+    try:
+        return _password_hasher.verify(password_hash, raw_password)
+    except (VerificationError, InvalidHashError):
+        return False
+
+
+def _password_needs_rehash(password_hash: str) -> bool:
+    if not password_hash.startswith(_ARGON2_PREFIX):
+        return True
+    return _password_hasher.check_needs_rehash(password_hash)
+
+
+def _hash_token(token_value: str) -> bytes:
+    return hashlib.sha256(token_value.encode("utf-8")).digest()
+
+
+class TokenCache:
+    """Thread-safe TTL cache mapping token hashes to authenticated engineers."""
+
+    def __init__(self, max_entries: int, ttl_seconds: float) -> None:
+        self._entries: TTLCache[bytes, AuthenticatedEngineer] = TTLCache(
+            maxsize=max_entries, ttl=ttl_seconds
+        )
+        self._lock = threading.Lock()
+
+    def get(self, token_hash: bytes) -> Optional[AuthenticatedEngineer]:
+        with self._lock:
+            return self._entries.get(token_hash)
+
+    def set(self, token_hash: bytes, engineer: AuthenticatedEngineer) -> None:
+        with self._lock:
+            self._entries[token_hash] = engineer
+
+    def discard(self, token_hash: bytes) -> None:
+        with self._lock:
+            self._entries.pop(token_hash, None)
+
+    def discard_engineer(self, engineer_id: int) -> None:
+        with self._lock:
+            stale = [key for key, value in self._entries.items() if value.id == engineer_id]
+            for key in stale:
+                self._entries.pop(key, None)
+
+
+@lru_cache(maxsize=1)
+def get_token_cache() -> Optional[TokenCache]:
+    """Return the process-wide token cache, or ``None`` when caching is disabled."""
+    settings = get_config().auth_cache
+    if not settings.enabled:
+        return None
+    return TokenCache(max_entries=settings.max_entries, ttl_seconds=settings.ttl_seconds)
 
 
 class AuthService:
     def __init__(self, db: Session) -> None:
         self._db = db
+        self._token_cache = get_token_cache()
 
-    def list_engineers(self) -> list[EngineerORM]:
-        stmt = select(EngineerORM).order_by(EngineerORM.username)
-        return list(self._db.scalars(stmt))
+    def list_engineers(self) -> Sequence[Row[Tuple[str, str, datetime]]]:
+        """Return ``(username, role, created_at)`` rows without hydrating ORM objects."""
+        stmt = select(EngineerORM.username, EngineerORM.role, EngineerORM.created_at).order_by(
+            EngineerORM.username
+        )
+        return self._db.execute(stmt).all()
 
     def ensure_admin(self, username: str, password: str) -> EngineerORM:
-        hashed = _hash_password(password)
         stmt = select(EngineerORM).where(EngineerORM.username == username)
         engineer = self._db.scalars(stmt).first()
         if engineer:
-            if engineer.password_hash != hashed:
-                engineer.password_hash = hashed
-                self._db.add(engineer)
-                self._db.commit()
+            dirty = False
+            if not _verify_password(engineer.password_hash, password) or _password_needs_rehash(
+                engineer.password_hash
+            ):
+                engineer.password_hash = _hash_password(password)
+                dirty = True
             if engineer.role != "admin":
                 engineer.role = "admin"
+                dirty = True
+            if dirty:
                 self._db.add(engineer)
                 self._db.commit()
             return engineer
 
         engineer = EngineerORM(
             username=username,
-            password_hash=hashed,
+            password_hash=_hash_password(password),
             role="admin",
         )
         self._db.add(engineer)
@@ -75,13 +155,17 @@ class AuthService:
         return engineer
 
     def authenticate(self, username: str, password: str) -> Optional[EngineerORM]:
-        hashed = _hash_password(password)
         stmt = select(EngineerORM).where(EngineerORM.username == username)
         engineer = self._db.scalars(stmt).first()
         if not engineer:
             return None
-        if engineer.password_hash != hashed:
+        if not _verify_password(engineer.password_hash, password):
             return None
+        if _password_needs_rehash(engineer.password_hash):
+            # Upgrade legacy SHA-256 hashes (and outdated argon2 parameters) on login.
+            engineer.password_hash = _hash_password(password)
+            self._db.add(engineer)
+            self._db.commit()
         return engineer
 
     def issue_token(self, engineer: EngineerORM) -> str:
@@ -89,25 +173,40 @@ class AuthService:
             delete(EngineerTokenORM).where(EngineerTokenORM.engineer_id == engineer.id)
         )
         token_value = secrets.token_urlsafe(32)
-        token = EngineerTokenORM(token=token_value, engineer_id=engineer.id)
+        token = EngineerTokenORM(token_hash=_hash_token(token_value), engineer_id=engineer.id)
         self._db.add(token)
         self._db.commit()
+        if self._token_cache is not None:
+            self._token_cache.discard_engineer(engineer.id)
         return token_value
 
     def revoke_token(self, token_value: str) -> None:
-        self._db.execute(delete(EngineerTokenORM).where(EngineerTokenORM.token == token_value))
+        token_hash = _hash_token(token_value)
+        self._db.execute(delete(EngineerTokenORM).where(EngineerTokenORM.token_hash == token_hash))
         self._db.commit()
+        if self._token_cache is not None:
+            self._token_cache.discard(token_hash)
+
+    def get_engineer_by_token(self, token_value: str) -> Optional[AuthenticatedEngineer]:
+        token_hash = _hash_token(token_value)
+        if self._token_cache is not None:
+            cached = self._token_cache.get(token_hash)
+            if cached is not None:
+                return cached
 
-    def get_engineer_by_token(self, token_value: str) -> Optional[EngineerORM]:
+        # One indexed JOIN projecting only the columns we need.
         stmt = (
-            select(EngineerTokenORM)
-            .options(selectinload(EngineerTokenORM.engineer))
-            .where(EngineerTokenORM.token == token_value)
+            select(EngineerORM.id, EngineerORM.username, EngineerORM.role)
+            .join(EngineerTokenORM, EngineerTokenORM.engineer_id == EngineerORM.id)
+            .where(EngineerTokenORM.token_hash == token_hash)
         )
-        token = self._db.scalars(stmt).first()
-        if not token:
+        row = self._db.execute(stmt).first()
+        if row is None:
             return None
-        return token.engineer
+        engineer = AuthenticatedEngineer(id=row.id, username=row.username, role=row.role)
+        if self._token_cache is not None:
+            self._token_cache.set(token_hash, engineer)
+        return engineer
 
 
 _bearer_scheme = HTTPBearer(auto_error=False)
@@ -125,17 +224,56 @@ def get_bearer_credentials(
     return credentials
 
 
-def get_current_engineer(
-    credentials: HTTPAuthorizationCredentials = Depends(get_bearer_credentials),
-    auth_service: AuthService = Depends(get_auth_service),
-) -> EngineerORM:
-    engineer = auth_service.get_engineer_by_token(credentials.credentials)
-    if engineer is None:
-        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid token")
-    return engineer
+def _resolve_engineer(token_value: str) -> Optional[AuthenticatedEngineer]:
+    with readonly_session() as db:
+        return AuthService(db).get_engineer_by_token(token_value)
+
+
+class BearerTokenBackend(AuthenticationBackend):
+    """Resolves the bearer token once per request for ``AuthenticationMiddleware``.
+
+    Requests without a valid token are left anonymous; routes that need an
+    engineer reject them through ``get_current_engineer``.
+    """
+
+    async def authenticate(
+        self, conn: HTTPConnection
+    ) -> Optional[Tuple[AuthCredentials, AuthenticatedEngineer]]:
+        authorization = conn.headers.get("authorization")
+        if not authorization:
+            return None
+        scheme, _, token_value = authorization.partition(" ")
+        if scheme.lower() != "bearer" or not token_value:
+            return None
+
+        token_cache = get_token_cache()
+        engineer = None
+        if token_cache is not None:
+            engineer = token_cache.get(_hash_token(token_value))
+        if engineer is None:
+            # Only a cache miss needs the database; keep it off the event loop.
+            engineer = await run_in_threadpool(_resolve_engineer, token_value)
+        if engineer is None:
+            return None
+        return AuthCredentials(["authenticated", engineer.role]), engineer
+
+
+async def get_current_engineer(
+    request: Request,
+    credentials: Optional[HTTPAuthorizationCredentials] = Depends(_bearer_scheme),
+) -> AuthenticatedEngineer:
+    engineer = request.scope.get("user")
+    if isinstance(engineer, AuthenticatedEngineer):
+        return engineer
+    # The bearer scheme dependency only parses the header; it also documents
+    # the security scheme in OpenAPI.
+    detail = "Not authenticated" if credentials is None else "Invalid token"
+    raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail=detail)
 
 
-def require_admin(engineer: EngineerORM = Depends(get_current_engineer)) -> EngineerORM:
+def require_admin(
+    engineer: AuthenticatedEngineer = Depends(get_current_engineer),
+) -> AuthenticatedEngineer:
     if engineer.role != "admin":
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Not enough privileges")
     return engineer
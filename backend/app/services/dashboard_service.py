@@ -4,8 +4,8 @@ from dataclasses import dataclass
 from datetime import datetime
 from typing import List, Optional
 
-from sqlalchemy import func, select
-from sqlalchemy.orm import Session as OrmSession, selectinload
+from sqlalchemy import Row, case, func, select
+from sqlalchemy.orm import Session as OrmSession
 
 from ..db.models import AnalysisORM, EngineerORM, SessionORM
 from ..models.session import SessionMode, SessionStatus
@@ -42,29 +42,37 @@ class DashboardService:
         self._db = db
 
     def collect_metrics(self, limit_latest: int = 5) -> DashboardMetrics:
-        total_sessions = self._count_sessions()
-        pending_sessions = self._count_sessions(status=SessionStatus.PENDING)
-        completed_sessions = self._count_sessions(status=SessionStatus.COMPLETED)
-        total_engineers = self._scalar(select(func.count()).select_from(EngineerORM))
-        total_analyses = self._scalar(select(func.count()).select_from(AnalysisORM))
+        totals = self._totals()
         sessions_by_mode = self._sessions_by_mode()
         latest_sessions = self._latest_sessions(limit_latest)
 
         return DashboardMetrics(
-            total_sessions=total_sessions,
-            pending_sessions=pending_sessions,
-            completed_sessions=completed_sessions,
-            total_engineers=total_engineers,
-            total_analyses=total_analyses,
+            total_sessions=totals.total_sessions,
+            pending_sessions=totals.pending_sessions,
+            completed_sessions=totals.completed_sessions,
+            total_engineers=totals.total_engineers,
+            total_analyses=totals.total_analyses,
             sessions_by_mode=sessions_by_mode,
             latest_sessions=latest_sessions,
         )
 
-    def _count_sessions(self, status: Optional[SessionStatus] = None) -> int:
-        stmt = select(func.count()).select_from(SessionORM)
-        if status is not None:
-            stmt = stmt.where(SessionORM.status == status.value)
-        return self._scalar(stmt)
+    def _totals(self) -> Row:
+        """Fetch every counter in one round trip and a single sessions scan."""
+        total_engineers = select(func.count()).select_from(EngineerORM).scalar_subquery()
+        total_analyses = select(func.count()).select_from(AnalysisORM).scalar_subquery()
+        stmt = select(
+            func.count().label("total_sessions"),
+            # COUNT(CASE ...) rather than COUNT(*) FILTER, which MySQL/MariaDB lack.
+            func.count(case((SessionORM.status == SessionStatus.PENDING.value, 1))).label(
+                "pending_sessions"
+            ),
+            func.count(case((SessionORM.status == SessionStatus.COMPLETED.value, 1))).label(
+                "completed_sessions"
+            ),
+            total_engineers.label("total_engineers"),
+            total_analyses.label("total_analyses"),
+        ).select_from(SessionORM)
+        return self._db.execute(stmt).one()
 
     def _sessions_by_mode(self) -> List[ModeBreakdown]:
         stmt = select(SessionORM.mode, func.count()).group_by(SessionORM.mode)
@@ -73,27 +81,25 @@ class DashboardService:
 
     def _latest_sessions(self, limit_latest: int) -> List[DashboardSessionSummary]:
         stmt = (
-            select(SessionORM)
-            .options(selectinload(SessionORM.engineer))
+            select(
+                SessionORM.session_id,
+                SessionORM.created_at,
+                SessionORM.status,
+                EngineerORM.id,
+                EngineerORM.username,
+            )
+            .outerjoin(EngineerORM, SessionORM.engineer_id == EngineerORM.id)
             .order_by(SessionORM.created_at.desc())
             .limit(limit_latest)
         )
-        rows = self._db.scalars(stmt).all()
-        summaries: List[DashboardSessionSummary] = []
-        for session in rows:
-            summaries.append(
-                DashboardSessionSummary(
-                    session_id=session.session_id,
-                    created_at=session.created_at,
-                    status=SessionStatus(session.status),
-                    engineer_id=session.engineer.id if session.engineer else None,
-                    engineer_username=session.engineer.username if session.engineer else None,
-                )
+        rows = self._db.execute(stmt).all()
+        return [
+            DashboardSessionSummary(
+                session_id=session_id,
+                created_at=created_at,
+                status=SessionStatus(status),
+                engineer_id=engineer_id,
+                engineer_username=engineer_username,
             )
-        return summaries
-
-    def _scalar(self, stmt) -> int:
-        value = self._db.scalar(stmt)
-        if value is None:
-            return 0
-        return int(value)
+            for session_id, created_at, status, engineer_id, engineer_username in rows
+        ]
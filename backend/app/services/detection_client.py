@@ -1,12 +1,18 @@
 from __future__ import annotations
 
 import asyncio
-import hashlib
+import importlib.util
+import json
 import logging
 import random
+import sys
+import zlib
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
+from functools import lru_cache
+from io import BytesIO
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Any, BinaryIO, Dict, List, Optional, Tuple, Union
 
 import httpx
 import yaml
@@ -16,7 +22,7 @@ from ..core.tool_catalog import TOOL_LOOKUP
 from ..models.session import DetectionItem
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class DetectionResult:
     tool_id: Optional[str]
     label: str
@@ -40,9 +46,48 @@ class DetectionClient:
     async def detect(self, image_path: Path) -> List[DetectionResult]:
         raise NotImplementedError
 
+    async def detect_bytes(self, data: bytes, filename: str) -> List[DetectionResult]:
+        """Run detection on an in-memory image without writing it to disk."""
+        raise NotImplementedError
+
     async def describe(self) -> DetectionBackendInfo:
         raise NotImplementedError
 
+    async def warmup(self) -> None:
+        """Load models ahead of the first request; a no-op for most backends."""
+
+    async def aclose(self) -> None:
+        """Release resources held by the backend (connections, models)."""
+
+
+@lru_cache(maxsize=256)
+def _mock_detections(seed: int) -> Tuple[DetectionResult, ...]:
+    """Fake detections derived deterministically from ``seed``."""
+    rng = random.Random(seed)
+    tool_ids = list(TOOL_LOOKUP.keys())
+    rng.shuffle(tool_ids)
+    keep_count = rng.randint(max(1, len(tool_ids) // 2), len(tool_ids))
+    selected = tool_ids[:keep_count]
+
+    results: List[DetectionResult] = []
+    for tool_id in selected:
+        tool = TOOL_LOOKUP[tool_id]
+        confidence = round(0.65 + rng.random() * 0.3, 3)
+        results.append(
+            DetectionResult(tool_id=tool_id, label=tool.name, confidence=confidence)
+        )
+
+    # Introduce occasional unknown detections to mimic false positives.
+    if rng.random() > 0.6:
+        results.append(
+            DetectionResult(
+                tool_id=None,
+                label="Unknown object",
+                confidence=round(0.4 + rng.random() * 0.3, 3),
+            )
+        )
+    return tuple(results)
+
 
 class MockDetectionClient(DetectionClient):
     """Deterministic mock for vision inference used during MVP phase."""
@@ -51,38 +96,26 @@ class MockDetectionClient(DetectionClient):
         self._latency_seconds = latency_seconds
 
     async def detect(self, image_path: Path) -> List[DetectionResult]:
-        seed = self._seed_from_path(image_path)
-        rng = random.Random(seed)
-        tool_ids = list(TOOL_LOOKUP.keys())
-        rng.shuffle(tool_ids)
-        keep_count = rng.randint(max(1, len(tool_ids) // 2), len(tool_ids))
-        selected = tool_ids[:keep_count]
-
-        results: List[DetectionResult] = []
-        for tool_id in selected:
-            tool = TOOL_LOOKUP[tool_id]
-            confidence = round(0.65 + rng.random() * 0.3, 3)
-            results.append(
-                DetectionResult(tool_id=tool_id, label=tool.name, confidence=confidence)
-            )
+        return await self._detect_seeded(self._seed_from_path(image_path))
 
-        # Introduce occasional unknown detections to mimic false positives.
-        if rng.random() > 0.6:
-            results.append(
-                DetectionResult(
-                    tool_id=None,
-                    label="Unknown object",
-                    confidence=round(0.4 + rng.random() * 0.3, 3),
-                )
-            )
+    async def detect_bytes(self, data: bytes, filename: str) -> List[DetectionResult]:
+        return await self._detect_seeded(self._seed(Path(filename).name, len(data)))
+
+    async def _detect_seeded(self, seed: int) -> List[DetectionResult]:
+        results = list(_mock_detections(seed))
         if self._latency_seconds:
             await asyncio.sleep(self._latency_seconds)
         return results
 
+    @classmethod
+    def _seed_from_path(cls, image_path: Path) -> int:
+        return cls._seed(image_path.name, image_path.stat().st_size)
+
     @staticmethod
-    def _seed_from_path(image_path: Path) -> int:
-        blob = f"{image_path.name}-{image_path.stat().st_size}".encode("utf-8")
-        return int(hashlib.sha256(blob).hexdigest(), 16) % (2**32)
+    def _seed(name: str, size: int) -> int:
+        # Only a stable 32-bit seed is needed, not a cryptographic digest; crc32
+        # is deterministic across processes, unlike the builtin hash().
+        return zlib.crc32(f"{name}-{size}".encode("utf-8"))
 
     async def describe(self) -> DetectionBackendInfo:
         return DetectionBackendInfo(
@@ -99,13 +132,28 @@ class HttpDetectionClient(DetectionClient):
     def __init__(self, base_url: str, timeout_seconds: float = 8.0) -> None:
         self._base_url = base_url.rstrip("/")
         self._timeout = timeout_seconds
+        # One long-lived client so uploads reuse pooled keep-alive connections.
+        self._client = httpx.AsyncClient(
+            base_url=self._base_url,
+            timeout=self._timeout,
+            limits=httpx.Limits(max_keepalive_connections=32, max_connections=64),
+        )
 
     async def detect(self, image_path: Path) -> List[DetectionResult]:
-        async with httpx.AsyncClient(timeout=self._timeout) as client:
-            files = {"file": (image_path.name, image_path.read_bytes(), "application/octet-stream")}
-            response = await client.post(f"{self._base_url}/detect", files=files)
-            response.raise_for_status()
-            payload = response.json()
+        # httpx streams file objects in chunks, so the image is never fully in memory.
+        with image_path.open("rb") as file_obj:
+            return await self._post_detect(image_path.name, file_obj)
+
+    async def detect_bytes(self, data: bytes, filename: str) -> List[DetectionResult]:
+        return await self._post_detect(filename, data)
+
+    async def _post_detect(
+        self, filename: str, content: Union[bytes, BinaryIO]
+    ) -> List[DetectionResult]:
+        files = {"file": (filename, content, "application/octet-stream")}
+        response = await self._client.post("/detect", files=files)
+        response.raise_for_status()
+        payload = response.json()
 
         detections: List[DetectionResult] = []
         for item in payload.get("detections", []):
@@ -126,6 +174,9 @@ class HttpDetectionClient(DetectionClient):
             classes=[],
         )
 
+    async def aclose(self) -> None:
+        await self._client.aclose()
+
 
 YOLO_INDEX_TO_TOOL_ID: Dict[int, str] = {
     0: "flat_screwdriver",
@@ -152,25 +203,156 @@ class YoloDetectionClient(DetectionClient):
         confidence_threshold: float,
         image_size: int,
         device: Optional[str] = None,
+        max_batch_size: int = 8,
+        export_format: Optional[str] = None,
+        precision: str = "fp32",
+        compile_model: bool = False,
     ) -> None:
         self._model_path = model_path
         self._dataset_config = dataset_config
         self._confidence = confidence_threshold
         self._image_size = image_size
         self._device = device
+        self._max_batch_size = max_batch_size
+        self._export_format = export_format
+        if precision == "int8" and not export_format:
+            logger.warning("INT8 precision requires YOLO_EXPORT_FORMAT; using fp32")
+            precision = "fp32"
+        elif precision == "int8" and export_format == "onnx":
+            logger.warning("Ultralytics ignores int8 for ONNX exports; the model stays fp32")
+        self._precision = precision
         self._class_names = self._load_class_names(dataset_config)
-        self._tool_lookup = TOOL_LOOKUP
-        try:
-            from ultralytics import YOLO  # type: ignore
-        except ImportError as exc:  # pragma: no cover - runtime safeguard
+        self._index_table = self._build_index_table(self._class_names)
+        # Only check availability here: importing ultralytics pulls in torch, which
+        # mock and HTTP deployments never need. The model loads on first use.
+        if importlib.util.find_spec("ultralytics") is None:  # pragma: no cover
             raise RuntimeError(
                 "Ultralytics is required for YOLO detection. Install it via requirements.txt"
-            ) from exc
-
+            )
         if not model_path.exists():
             raise FileNotFoundError(f"YOLO model weights not found: {model_path}")
-        logger.info("Loading YOLO model from %s", model_path)
-        self._model = YOLO(str(model_path))
+        self._compile = compile_model and not export_format and "cuda" in str(device or "")
+        self._model: Any = None
+        # Set once loading has been attempted; loading is never retried, so a broken
+        # model cannot trigger a reload (or re-export) per request.
+        self._load: Optional[asyncio.Future[None]] = None
+        self._fallback: Optional[DetectionClient] = None
+        # predict() is not safe to call concurrently on one model, and running it
+        # on the default pool would starve other to_thread work (upload copies).
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="yolo")
+        # Requests waiting for inference; drained in batches by _run_batches().
+        self._queue: "asyncio.Queue[Tuple[Any, asyncio.Future[List[DetectionResult]]]]" = (
+            asyncio.Queue()
+        )
+        self._batcher: Optional[asyncio.Task[None]] = None
+
+    def _load_model(self) -> None:
+        """Load the model, or switch to the mock on failure; runs on the inference thread."""
+        try:
+            from ultralytics import YOLO  # type: ignore
+
+            if self._export_format:
+                self._model = YOLO(self._exported_model_path(YOLO), task="detect")
+            else:
+                logger.info("Loading YOLO model from %s", self._model_path)
+                self._model = YOLO(str(self._model_path))
+            if self._compile:
+                self._compile_model()
+        except Exception as exc:  # pragma: no cover - fallback safety
+            logger.warning("Falling back to mock detection client: %s", exc)
+            self._model = None
+            self._fallback = MockDetectionClient()
+
+    async def _model_ready(self) -> bool:
+        """Wait for the model to load; ``False`` means requests go to the fallback."""
+        if self._load is None:
+            loop = asyncio.get_running_loop()
+            self._load = loop.run_in_executor(self._executor, self._load_model)
+        # Shielded so that a cancelled request does not cancel the shared load.
+        await asyncio.shield(self._load)
+        return self._fallback is None
+
+    async def warmup(self) -> None:
+        await self._model_ready()
+
+    def _exported_model_path(self, yolo_cls: Any) -> str:
+        """Return the exported model next to the weights, exporting it when stale.
+
+        Ultralytics picks the artifact name itself (``best.engine``,
+        ``best_int8_openvino_model``...) and ignores most settings in it, so the
+        returned path and the settings it was built with are kept in a sidecar
+        file. A change of weights, precision, image size or batch re-exports.
+        """
+        settings = self._export_settings()
+        sidecar = self._model_path.with_name(
+            f"{self._model_path.stem}_{self._export_format}_export.json"
+        )
+        try:
+            recorded = json.loads(sidecar.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            recorded = {}
+        exported = recorded.get("path")
+        if recorded.get("settings") == settings and exported and Path(exported).exists():
+            logger.info("Loading exported YOLO model from %s", exported)
+            return exported
+
+        logger.info("Exporting %s to %s format", self._model_path, self._export_format)
+        # A dynamic batch dimension keeps micro-batched predict() calls working.
+        exported = str(
+            yolo_cls(str(self._model_path)).export(
+                format=self._export_format,
+                imgsz=self._image_size,
+                dynamic=True,
+                batch=self._max_batch_size,
+                device=self._device,
+                half=self._precision == "fp16",
+                int8=self._precision == "int8",
+                data=str(self._dataset_config),
+            )
+        )
+        sidecar.write_text(
+            json.dumps({"path": exported, "settings": settings}), encoding="utf-8"
+        )
+        return exported
+
+    def _export_settings(self) -> Dict[str, Any]:
+        weights = self._model_path.stat()
+        return {
+            "weights_size": weights.st_size,
+            "weights_mtime_ns": weights.st_mtime_ns,
+            "precision": self._precision,
+            "image_size": self._image_size,
+            "max_batch_size": self._max_batch_size,
+        }
+
+    def _compile_model(self) -> None:
+        import numpy as np  # installed together with ultralytics
+        import torch  # type: ignore
+
+        eager = self._model.model
+        try:
+            self._model.model = torch.compile(eager, mode="reduce-overhead")
+            # Pay the compilation cost while loading rather than on the first request.
+            warmup = np.zeros((self._image_size, self._image_size, 3), dtype=np.uint8)
+            self._predict_batch([warmup])
+        except Exception as exc:  # pragma: no cover - depends on the torch build
+            logger.warning("torch.compile failed, using the eager YOLO model: %s", exc)
+            self._model.model = eager
+        else:
+            logger.info("Compiled the YOLO model with torch.compile")
+
+    @staticmethod
+    def _build_index_table(class_names: Dict[int, str]) -> List[Tuple[Optional[str], str]]:
+        """Map each model class index to its ``(tool_id, label)`` pair."""
+        table: List[Tuple[Optional[str], str]] = []
+        for index in range(max(class_names, default=-1) + 1):
+            tool_id = YOLO_INDEX_TO_TOOL_ID.get(index)
+            if tool_id in TOOL_LOOKUP:
+                label = TOOL_LOOKUP[tool_id].name
+            else:
+                label = class_names.get(index, f"class_{index}")
+            table.append((tool_id, sys.intern(label)))
+        return table
 
     @staticmethod
     def _load_class_names(dataset_config: Path) -> Dict[int, str]:
@@ -186,34 +368,119 @@ class YoloDetectionClient(DetectionClient):
         return {int(idx): str(name) for idx, name in names.items()}
 
     async def detect(self, image_path: Path) -> List[DetectionResult]:
-        return await asyncio.to_thread(self._predict, image_path)
+        if not await self._model_ready():
+            return await self._fallback.detect(image_path)
+        return await self._submit(str(image_path))
+
+    async def detect_bytes(self, data: bytes, filename: str) -> List[DetectionResult]:
+        if not await self._model_ready():
+            return await self._fallback.detect_bytes(data, filename)
+        image = await asyncio.to_thread(self._decode_image, data)
+        return await self._submit(image)
+
+    @staticmethod
+    def _decode_image(data: bytes) -> Any:
+        from PIL import Image  # installed together with ultralytics
+
+        image = Image.open(BytesIO(data))
+        image.load()
+        return image
+
+    async def _submit(self, source: Any) -> List[DetectionResult]:
+        if self._batcher is None or self._batcher.done():
+            self._batcher = asyncio.create_task(self._run_batches())
+        future: asyncio.Future[List[DetectionResult]] = (
+            asyncio.get_running_loop().create_future()
+        )
+        self._queue.put_nowait((source, future))
+        return await future
+
+    async def _run_batches(self) -> None:
+        """Feed queued sources to the model, several per predict call.
+
+        Nothing waits for a batch to fill: whatever queued up while the previous
+        batch was running goes into the next one, so an idle server keeps its
+        single-image latency.
+        """
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._queue.get()]
+            while len(batch) < self._max_batch_size:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except asyncio.QueueEmpty:
+                    break
+
+            sources = [source for source, _ in batch]
+            try:
+                results = await loop.run_in_executor(
+                    self._executor, self._predict_batch, sources
+                )
+            except Exception as exc:
+                if len(batch) == 1:
+                    _, future = batch[0]
+                    if not future.done():
+                        future.set_exception(exc)
+                else:
+                    # One unreadable image fails the whole call; retry one by one so
+                    # the error only reaches the request that sent it.
+                    await self._predict_each(batch)
+                continue
+            for (_, future), detections in zip(batch, results):
+                if not future.done():
+                    future.set_result(detections)
 
-    def _predict(self, image_path: Path) -> List[DetectionResult]:
-        results = self._model.predict(  # type: ignore[attr-defined]
-            source=str(image_path),
+    async def _predict_each(
+        self, batch: List[Tuple[Any, "asyncio.Future[List[DetectionResult]]"]]
+    ) -> None:
+        loop = asyncio.get_running_loop()
+        for source, future in batch:
+            try:
+                results = await loop.run_in_executor(
+                    self._executor, self._predict_batch, [source]
+                )
+            except Exception as exc:
+                if not future.done():
+                    future.set_exception(exc)
+            else:
+                if not future.done():
+                    future.set_result(results[0])
+
+    def _predict_batch(self, sources: List[Any]) -> List[List[DetectionResult]]:
+        results = self._model.predict(
+            source=sources,
             imgsz=self._image_size,
             conf=self._confidence,
             device=self._device,
+            half=self._precision == "fp16",
             verbose=False,
         )
+        return [self._to_detections(result) for result in results]
+
+    def _to_detections(self, result: Any) -> List[DetectionResult]:
         detections: List[DetectionResult] = []
-        for result in results:
-            boxes = getattr(result, "boxes", None)
-            if boxes is None:
-                continue
-            for box in boxes:
-                cls_index = int(box.cls.item()) if hasattr(box.cls, "item") else int(box.cls)
-                confidence = float(box.conf.item() if hasattr(box.conf, "item") else box.conf)
-                label = self._class_names.get(cls_index, f"class_{cls_index}")
-                tool_id = YOLO_INDEX_TO_TOOL_ID.get(cls_index)
-                if tool_id and tool_id in self._tool_lookup:
-                    label = self._tool_lookup[tool_id].name
-                detections.append(
-                    DetectionResult(tool_id=tool_id, label=label, confidence=round(confidence, 4))
-                )
+        boxes = getattr(result, "boxes", None)
+        if boxes is None:
+            return detections
+        # One device-to-host copy for the whole result instead of one per box value.
+        boxes = boxes.cpu().numpy()
+        class_indices = boxes.cls.astype(int).tolist()
+        confidences = boxes.conf.tolist()
+        table = self._index_table
+        for cls_index, confidence in zip(class_indices, confidences):
+            if 0 <= cls_index < len(table):
+                tool_id, label = table[cls_index]
+            else:
+                tool_id, label = None, f"class_{cls_index}"
+            detections.append(
+                DetectionResult(tool_id=tool_id, label=label, confidence=round(confidence, 4))
+            )
         return detections
 
     async def describe(self) -> DetectionBackendInfo:
+        # Report what actually serves requests, which is only known after loading.
+        if not await self._model_ready():
+            return await self._fallback.describe()
         return DetectionBackendInfo(
             backend="yolo",
             configured=True,
@@ -223,14 +490,26 @@ class YoloDetectionClient(DetectionClient):
                 "confidence_threshold": str(self._confidence),
                 "image_size": str(self._image_size),
                 "device": self._device or "auto",
+                "max_batch_size": str(self._max_batch_size),
+                "export_format": self._export_format,
+                "precision": self._precision,
+                # Configuration only: the status body is cached for the process lifetime.
+                "compile": str(self._compile),
             },
             classes=[self._class_names[idx] for idx in sorted(self._class_names)],
         )
 
+    async def aclose(self) -> None:
+        if self._batcher is not None:
+            self._batcher.cancel()
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
 
 def detection_client_factory(config: AppConfig) -> DetectionClient:
     if config.detection_service_url:
-        return HttpDetectionClient(config.detection_service_url, config.detection_timeout_seconds)
+        return HttpDetectionClient(
+            str(config.detection_service_url), config.detection_timeout_seconds
+        )
 
     try:
         return YoloDetectionClient(
@@ -239,6 +518,10 @@ def detection_client_factory(config: AppConfig) -> DetectionClient:
             confidence_threshold=config.yolo_confidence_threshold,
             image_size=config.yolo_image_size,
             device=config.yolo_device,
+            max_batch_size=config.yolo_max_batch_size,
+            export_format=config.yolo_export_format,
+            precision=config.yolo_precision,
+            compile_model=config.yolo_compile,
         )
     except Exception as exc:  # pragma: no cover - fallback safety
         logger.warning("Falling back to mock detection client: %s", exc)
@@ -252,12 +535,16 @@ def detection_items_from_results(results: List[DetectionResult]) -> List[Detecti
     ]
 
 
-_DETECTION_CLIENT: Optional[DetectionClient] = None
+@lru_cache(maxsize=1)
+def get_detection_client() -> DetectionClient:
+    # The app lifespan calls this once at startup, before requests can race on it.
+    return detection_client_factory(get_config())
 
 
-def get_detection_client() -> DetectionClient:
-    global _DETECTION_CLIENT
-    if _DETECTION_CLIENT is None:
-        config = get_config()
-        _DETECTION_CLIENT = detection_client_factory(config)
-    return _DETECTION_CLIENT
+async def close_detection_client() -> None:
+    """Close the shared detection client, if one was created; used at shutdown."""
+    if not get_detection_client.cache_info().currsize:
+        return
+    client = get_detection_client()
+    get_detection_client.cache_clear()
+    await client.aclose()
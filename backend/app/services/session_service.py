@@ -1,17 +1,26 @@
 from __future__ import annotations
 
+import asyncio
+import shutil
 import uuid
-from dataclasses import asdict
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import List, Optional, Tuple
+from typing import BinaryIO, Dict, Iterator, List, Optional, Tuple
 
 from fastapi import UploadFile
-from sqlalchemy import select
-from sqlalchemy.orm import Session as OrmSession, selectinload
+from sqlalchemy import Select, and_, func, or_, select, tuple_
+from sqlalchemy.orm import Session as OrmSession, lazyload, selectinload
 
 from ..core.config import get_config
-from ..core.tool_catalog import TOOL_LOOKUP, get_default_tool_ids
-from ..db.models import AnalysisORM, EngineerORM, SessionORM
+from ..core.ids import uuid7
+from ..core.tool_catalog import (
+    TOOL_BIT,
+    get_default_tool_ids,
+    mask_to_tool_ids,
+    tool_ids_to_mask,
+)
+from ..db.models import AnalysisORM, SessionORM
+from ..models.engineer import AuthenticatedEngineer
 from ..models.session import (
     AnalysisSnapshot,
     DetectionItem,
@@ -19,14 +28,25 @@ from ..models.session import (
     SessionMode,
     SessionRecord,
     SessionStatus,
+    SessionSummary,
 )
 from .detection_client import DetectionClient, detection_items_from_results
 
 
+UPLOAD_CHUNK_SIZE = 1 << 20
+# Uploads of one batch request analysed at the same time.
+ANALYSE_CONCURRENCY = 8
+
+
 class SessionNotFoundError(Exception):
     pass
 
 
+def _copy_upload(source: BinaryIO, target_path: Path) -> None:
+    with target_path.open("wb") as target:
+        shutil.copyfileobj(source, target, UPLOAD_CHUNK_SIZE)
+
+
 class SessionService:
     def __init__(self, db: OrmSession, detection_client: DetectionClient) -> None:
         self._db = db
@@ -36,19 +56,20 @@ class SessionService:
     def create_session(
         self,
         mode: SessionMode,
-        engineer: EngineerORM,
+        engineer: AuthenticatedEngineer,
         expected_tool_ids: Optional[List[str]] = None,
         threshold: float = 0.9,
     ) -> SessionRecord:
         tools = expected_tool_ids or get_default_tool_ids()
-        validated_tools = list(dict.fromkeys(tool_id for tool_id in tools if tool_id in TOOL_LOOKUP))
-        if not validated_tools:
+        # The mask ignores unknown ids and duplicates; order is not kept anyway.
+        expected_mask = tool_ids_to_mask(tools)
+        if not expected_mask:
             raise ValueError("At least one valid tool_id must be provided")
 
         session = SessionORM(
-            session_id=str(uuid.uuid4()),
+            session_id=str(uuid7()),
             mode=mode.value,
-            expected_tool_ids=validated_tools,
+            expected_tool_mask=expected_mask,
             threshold=threshold,
             status=SessionStatus.PENDING.value,
             engineer_id=engineer.id,
@@ -59,7 +80,71 @@ class SessionService:
         return self._to_record(session)
 
     def list_sessions(self) -> List[SessionRecord]:
+        sessions = self._db.scalars(self._list_sessions_stmt()).all()
+        return [self._to_record(session) for session in sessions]
+
+    def list_session_page(
+        self, limit: int, after: Optional[Tuple[datetime, str]] = None
+    ) -> Tuple[List[SessionSummary], Optional[Tuple[datetime, str]]]:
+        """Return up to ``limit`` sessions older than the ``after`` key, newest first.
+
+        Keys are ``(created_at, session_id)`` pairs; the second element of the
+        result is the key to pass as ``after`` for the next page, or ``None``
+        when there are no more sessions.
+        """
         stmt = (
+            select(SessionORM)
+            .options(selectinload(SessionORM.engineer), lazyload(SessionORM.analyses))
+            .order_by(SessionORM.created_at.desc(), SessionORM.session_id.desc())
+            .limit(limit + 1)
+        )
+        if after is not None:
+            # A plain tuple lets SQLAlchemy bind each element with its column type,
+            # so the cursor datetime goes through UTCDateTime's normalisation.
+            stmt = stmt.where(tuple_(SessionORM.created_at, SessionORM.session_id) < after)
+        rows = self._db.scalars(stmt).all()
+        page = rows[:limit]
+        latest = self._latest_analyses([row.session_id for row in page])
+        summaries = [
+            SessionSummary(
+                session_id=row.session_id,
+                mode=SessionMode(row.mode),
+                expected_tool_ids=mask_to_tool_ids(row.expected_tool_mask),
+                threshold=row.threshold,
+                created_at=row.created_at,
+                status=SessionStatus(row.status),
+                engineer=self._to_engineer(row),
+                latest_analysis=latest.get(row.session_id),
+            )
+            for row in page
+        ]
+        next_key = (page[-1].created_at, page[-1].session_id) if len(rows) > limit else None
+        return summaries, next_key
+
+    def _latest_analyses(self, session_ids: List[str]) -> Dict[str, AnalysisSnapshot]:
+        if not session_ids:
+            return {}
+        latest = (
+            select(
+                AnalysisORM.session_id,
+                func.max(AnalysisORM.created_at).label("created_at"),
+            )
+            .where(AnalysisORM.session_id.in_(session_ids))
+            .group_by(AnalysisORM.session_id)
+            .subquery()
+        )
+        stmt = select(AnalysisORM).join(
+            latest,
+            and_(
+                AnalysisORM.session_id == latest.c.session_id,
+                AnalysisORM.created_at == latest.c.created_at,
+            ),
+        )
+        return {row.session_id: self._to_snapshot(row) for row in self._db.scalars(stmt)}
+
+    @staticmethod
+    def _list_sessions_stmt() -> Select[Tuple[SessionORM]]:
+        return (
             select(SessionORM)
             .options(
                 selectinload(SessionORM.analyses),
@@ -67,10 +152,14 @@ class SessionService:
             )
             .order_by(SessionORM.created_at.desc())
         )
-        sessions = self._db.scalars(stmt).all()
-        return [self._to_record(session) for session in sessions]
 
-    def get_session(self, session_id: str) -> SessionRecord:
+    def get_session(
+        self,
+        session_id: str,
+        engineer_id: Optional[int] = None,
+        is_admin: bool = False,
+    ) -> SessionRecord:
+        """Load a session; when ``engineer_id`` is given, non-admins only see their own."""
         stmt = (
             select(SessionORM)
             .options(
@@ -79,6 +168,10 @@ class SessionService:
             )
             .where(SessionORM.session_id == session_id)
         )
+        if engineer_id is not None and not is_admin:
+            stmt = stmt.where(
+                or_(SessionORM.engineer_id.is_(None), SessionORM.engineer_id == engineer_id)
+            )
         session = self._db.scalars(stmt).first()
         if session is None:
             raise SessionNotFoundError(session_id)
@@ -93,30 +186,107 @@ class SessionService:
         if session is None:
             raise SessionNotFoundError(session_id)
 
-        saved_path = await self._persist_upload(upload)
+        snapshot, analysis_row = await self._analyse_upload(
+            session, upload, self._upload_path(upload)
+        )
+        self._db.add(analysis_row)
+        if self._is_clean(snapshot):
+            session.status = SessionStatus.COMPLETED.value
+        self._db.commit()
+
+        # The session and its earlier analyses are already loaded (and not expired
+        # on commit), so append the new snapshot instead of re-querying.
+        updated_session = self._to_record(session)
+        updated_session.add_analysis(snapshot)
+        return snapshot, updated_session
+
+    async def analyse_images(
+        self,
+        session_id: str,
+        uploads: List[UploadFile],
+    ) -> Tuple[List[AnalysisSnapshot], SessionRecord]:
+        """Analyse several uploads concurrently; snapshots keep the upload order.
+
+        All or nothing: if any upload fails, the remaining ones are cancelled,
+        the images already saved are deleted, no analysis is stored and the first
+        error is raised.
+        """
+        session = self._db.get(SessionORM, session_id)
+        if session is None:
+            raise SessionNotFoundError(session_id)
+
+        semaphore = asyncio.Semaphore(ANALYSE_CONCURRENCY)
+        saved_paths: List[Path] = []
+
+        async def analyse_one(upload: UploadFile) -> Tuple[AnalysisSnapshot, AnalysisORM]:
+            async with semaphore:
+                target_path = self._upload_path(upload)
+                saved_paths.append(target_path)
+                return await self._analyse_upload(session, upload, target_path)
+
+        try:
+            async with asyncio.TaskGroup() as group:
+                tasks = [group.create_task(analyse_one(upload)) for upload in uploads]
+        except ExceptionGroup as errors:
+            for path in saved_paths:
+                path.unlink(missing_ok=True)
+            raise errors.exceptions[0] from None
+
+        # Only the database work remains, and it all happens after every upload
+        # has been analysed, in a single transaction.
+        results = [task.result() for task in tasks]
+        # Tasks finish in any order; stamp the batch in upload order so that reloads
+        # (ordered by created_at) and the "latest analysis" follow the request.
+        batch_started = datetime.now(timezone.utc)
+        for index, (snapshot, analysis_row) in enumerate(results):
+            snapshot.created_at = analysis_row.created_at = batch_started + timedelta(
+                microseconds=index
+            )
+        self._db.add_all([analysis_row for _, analysis_row in results])
+        snapshots = [snapshot for snapshot, _ in results]
+        if any(self._is_clean(snapshot) for snapshot in snapshots):
+            session.status = SessionStatus.COMPLETED.value
+        self._db.commit()
+
+        updated_session = self._to_record(session)
+        for snapshot in snapshots:
+            updated_session.add_analysis(snapshot)
+        return snapshots, updated_session
+
+    async def _analyse_upload(
+        self, session: SessionORM, upload: UploadFile, saved_path: Path
+    ) -> Tuple[AnalysisSnapshot, AnalysisORM]:
+        """Store and analyse one upload; the returned row is not added to the session."""
+        await self._persist_upload(upload, saved_path)
         detection_results = await self._detection_client.detect(saved_path)
         detection_items = detection_items_from_results(detection_results)
 
-        expected = set(session.expected_tool_ids or [])
-        detected_tool_ids = {item.tool_id for item in detection_items if item.tool_id}
-        matched_tool_ids = sorted(expected & detected_tool_ids)
-        missing_tool_ids = sorted(expected - detected_tool_ids)
-        unexpected = {
-            item.label
-            for item in detection_items
-            if (item.tool_id and item.tool_id not in expected) or item.tool_id is None
-        }
+        # Single pass: one bit lookup per detection feeds both the detected mask
+        # and the unexpected labels (unknown tools map to bit 0).
+        expected_mask = session.expected_tool_mask
+        detected_mask = 0
+        unexpected = set()
+        for item in detection_items:
+            bit = TOOL_BIT.get(item.tool_id, 0)
+            detected_mask |= bit
+            if not expected_mask & bit:
+                unexpected.add(item.label)
+        matched_mask = expected_mask & detected_mask
+        missing_mask = expected_mask & ~detected_mask
         unexpected_labels = sorted(unexpected)
 
-        match_ratio = round(len(matched_tool_ids) / len(expected), 3) if expected else 1.0
+        expected_count = expected_mask.bit_count()
+        match_ratio = (
+            round(matched_mask.bit_count() / expected_count, 3) if expected_count else 1.0
+        )
         below_threshold = match_ratio < session.threshold
 
         snapshot = AnalysisSnapshot(
-            request_id=str(uuid.uuid4()),
+            request_id=str(uuid7()),
             image_filename=saved_path.name,
             detected=detection_items,
-            matched_tool_ids=matched_tool_ids,
-            missing_tool_ids=missing_tool_ids,
+            matched_tool_ids=mask_to_tool_ids(matched_mask),
+            missing_tool_ids=mask_to_tool_ids(missing_mask),
             unexpected_labels=unexpected_labels,
             match_ratio=match_ratio,
             below_threshold=below_threshold,
@@ -126,59 +296,67 @@ class SessionService:
             request_id=snapshot.request_id,
             session_id=session.session_id,
             image_filename=snapshot.image_filename,
-            detected=[asdict(item) for item in snapshot.detected],
-            matched_tool_ids=snapshot.matched_tool_ids,
-            missing_tool_ids=snapshot.missing_tool_ids,
+            detected=[
+                {"tool_id": item.tool_id, "label": item.label, "confidence": item.confidence}
+                for item in snapshot.detected
+            ],
+            matched_tool_mask=matched_mask,
+            missing_tool_mask=missing_mask,
             unexpected_labels=snapshot.unexpected_labels,
             match_ratio=snapshot.match_ratio,
             below_threshold=snapshot.below_threshold,
             created_at=snapshot.created_at,
         )
-        self._db.add(analysis_row)
+        return snapshot, analysis_row
 
-        if not snapshot.missing_tool_ids and not snapshot.unexpected_labels and not snapshot.below_threshold:
-            session.status = SessionStatus.COMPLETED.value
+    @staticmethod
+    def _is_clean(snapshot: AnalysisSnapshot) -> bool:
+        return (
+            not snapshot.missing_tool_ids
+            and not snapshot.unexpected_labels
+            and not snapshot.below_threshold
+        )
 
-        self._db.commit()
-        self._db.refresh(analysis_row)
+    def _upload_path(self, upload: UploadFile) -> Path:
+        # upload_dir is created once at startup by AppConfig.ensure_runtime_dirs.
+        suffix = Path(upload.filename or "upload").suffix or ".bin"
+        return self._config.upload_dir / f"{uuid.uuid4()}{suffix}"
 
-        updated_session = self.get_session(session.session_id)
-        return snapshot, updated_session
+    async def _persist_upload(self, upload: UploadFile, target_path: Path) -> None:
+        # One thread hop for the whole copy instead of one per chunk read and write.
+        copy = asyncio.ensure_future(asyncio.to_thread(_copy_upload, upload.file, target_path))
+        try:
+            await asyncio.shield(copy)
+        except asyncio.CancelledError:
+            # The worker thread cannot be interrupted; let it finish so that callers
+            # cleaning up after a cancellation never race a file still being written.
+            await asyncio.wait([copy])
+            raise
 
-    async def _persist_upload(self, upload: UploadFile) -> Path:
-        target_dir = self._config.upload_dir
-        target_dir.mkdir(parents=True, exist_ok=True)
-        suffix = Path(upload.filename or "upload").suffix or ".bin"
-        target_path = target_dir / f"{uuid.uuid4()}{suffix}"
-        data = await upload.read()
-        with target_path.open("wb") as file_obj:
-            file_obj.write(data)
-        await upload.seek(0)
-        return target_path
-
-    def _to_record(self, session_row: SessionORM) -> SessionRecord:
-        engineer_info = None
-        if session_row.engineer:
-            engineer_info = SessionEngineer(
-                id=session_row.engineer.id,
-                username=session_row.engineer.username,
-            )
+    @staticmethod
+    def _to_engineer(session_row: SessionORM) -> Optional[SessionEngineer]:
+        if not session_row.engineer:
+            return None
+        return SessionEngineer(id=session_row.engineer.id, username=session_row.engineer.username)
 
+    @classmethod
+    def _to_record(cls, session_row: SessionORM) -> SessionRecord:
         record = SessionRecord(
             session_id=session_row.session_id,
             mode=SessionMode(session_row.mode),
-            expected_tool_ids=list(session_row.expected_tool_ids or []),
+            expected_tool_ids=mask_to_tool_ids(session_row.expected_tool_mask),
             threshold=session_row.threshold,
             created_at=session_row.created_at,
             status=SessionStatus(session_row.status),
-            engineer=engineer_info,
+            engineer=cls._to_engineer(session_row),
         )
-        analyses = sorted(session_row.analyses or [], key=lambda item: item.created_at)
-        for analysis in analyses:
-            record.add_analysis(self._to_snapshot(analysis))
+        # The relationship is ordered by created_at, so rows arrive sorted.
+        for analysis in session_row.analyses:
+            record.add_analysis(cls._to_snapshot(analysis))
         return record
 
-    def _to_snapshot(self, analysis_row: AnalysisORM) -> AnalysisSnapshot:
+    @staticmethod
+    def _to_snapshot(analysis_row: AnalysisORM) -> AnalysisSnapshot:
         detected_payload = analysis_row.detected or []
         detected_items = [
             DetectionItem(
@@ -192,10 +370,21 @@ class SessionService:
             request_id=analysis_row.request_id,
             image_filename=analysis_row.image_filename,
             detected=detected_items,
-            matched_tool_ids=list(analysis_row.matched_tool_ids or []),
-            missing_tool_ids=list(analysis_row.missing_tool_ids or []),
+            matched_tool_ids=mask_to_tool_ids(analysis_row.matched_tool_mask),
+            missing_tool_ids=mask_to_tool_ids(analysis_row.missing_tool_mask),
             unexpected_labels=list(analysis_row.unexpected_labels or []),
             match_ratio=analysis_row.match_ratio,
             below_threshold=analysis_row.below_threshold,
             created_at=analysis_row.created_at,
         )
+
+
+def iter_sessions(db: OrmSession, batch_size: int = 200) -> Iterator[SessionRecord]:
+    """Yield sessions newest first, fetching rows in batches of ``batch_size``.
+
+    A plain function rather than a ``SessionService`` method: streaming callers
+    open their own database session and need no detection client.
+    """
+    stmt = SessionService._list_sessions_stmt().execution_options(yield_per=batch_size)
+    for session in db.scalars(stmt):
+        yield SessionService._to_record(session)
@@ -0,0 +1,89 @@
+"""Response serializers skip validation (``model_construct``) for speed.
+
+These tests validate their output against the schemas, so a service that starts
+returning a mistyped or missing field fails here instead of in the clients.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from io import BytesIO
+from pathlib import Path
+
+import pytest
+from fastapi import UploadFile
+from pydantic import BaseModel
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import StaticPool
+
+from backend.app.core.config import AppConfig
+from backend.app.db.base import Base
+from backend.app.db.models import EngineerORM
+from backend.app.models.engineer import AuthenticatedEngineer
+from backend.app.models.session import SessionMode
+from backend.app.schemas import (
+    serialize_analysis,
+    serialize_dashboard_metrics,
+    serialize_detection_metadata,
+    serialize_detection_results,
+    serialize_session,
+    serialize_session_page,
+    serialize_sessions,
+)
+from backend.app.services.dashboard_service import DashboardService
+from backend.app.services.detection_client import MockDetectionClient
+from backend.app.services.session_service import SessionService
+
+
+def assert_valid(response: BaseModel) -> None:
+    type(response).model_validate(response.model_dump(), strict=True)
+
+
+@pytest.fixture
+def db() -> Session:
+    engine = create_engine(
+        "sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool
+    )
+    Base.metadata.create_all(engine)
+    with Session(engine, expire_on_commit=False) as session:
+        yield session
+
+
+@pytest.fixture
+def engineer(db: Session) -> AuthenticatedEngineer:
+    row = EngineerORM(username="engineer", password_hash="-", role="engineer")
+    db.add(row)
+    db.commit()
+    return AuthenticatedEngineer(id=row.id, username=row.username, role=row.role)
+
+
+@pytest.fixture
+def session_service(db: Session, tmp_path: Path) -> SessionService:
+    service = SessionService(db=db, detection_client=MockDetectionClient(latency_seconds=0))
+    service._config = AppConfig(upload_dir=tmp_path)
+    return service
+
+
+def test_session_and_analysis_responses(
+    db: Session, session_service: SessionService, engineer: AuthenticatedEngineer
+) -> None:
+    session = session_service.create_session(SessionMode.HANDOUT, engineer)
+    upload = UploadFile(file=BytesIO(b"image"), filename="desk.png")
+    analysis, updated = asyncio.run(session_service.analyse_image(session.session_id, upload))
+
+    assert_valid(serialize_analysis(updated, analysis))
+    assert_valid(serialize_session(session_service.get_session(session.session_id)))
+    assert_valid(serialize_sessions(session_service.list_sessions()))
+    summaries, _ = session_service.list_session_page(limit=10)
+    assert_valid(serialize_session_page(summaries, None))
+
+    assert_valid(serialize_dashboard_metrics(DashboardService(db).collect_metrics()))
+
+
+def test_detection_responses() -> None:
+    client = MockDetectionClient(latency_seconds=0)
+    results = asyncio.run(client.detect_bytes(b"image", "desk.png"))
+
+    assert_valid(serialize_detection_results(results))
+    assert_valid(serialize_detection_metadata(asyncio.run(client.describe())))